@@ -11,6 +11,7 @@ from unittest.mock import patch, MagicMock
 import yt_dlp
 
 from yt_dl_manager.daemon import YTDLManagerDaemon, MAX_RETRIES
+from yt_dl_manager.db_utils import DownloadStatus
 from tests.test_utils import create_test_schema
 
 
@@ -187,8 +188,9 @@ class TestYTDLManagerDaemon(unittest.TestCase):
             mock_config.__getitem__.return_value = mock_default_section
 
             # Test download
-            self.daemon.download_media(row_id, test_url, 0)
+            status = self.daemon.download_media(row_id, test_url, 0)
 
+        self.assertIs(status, DownloadStatus.DOWNLOADED)
         # Verify yt-dlp was called correctly
         mock_ytdl_instance.extract_info.assert_called_once_with(
             test_url, download=True
@@ -237,7 +239,9 @@ class TestYTDLManagerDaemon(unittest.TestCase):
             mock_config.__getitem__.return_value = mock_default_section
 
             # Test download with retry count below max
-            self.daemon.download_media(row_id, test_url, 1)
+            status = self.daemon.download_media(row_id, test_url, 1)
+
+        self.assertIs(status, DownloadStatus.PENDING)
 
         # Verify database was updated for retry
         conn = sqlite3.connect(self.test_db_path)
@@ -259,6 +263,22 @@ class TestYTDLManagerDaemon(unittest.TestCase):
         )
         mock_print.assert_called_with(expected_message)
 
+    @patch('yt_dl_manager.download_utils.yt_dlp.YoutubeDL')
+    def test_download_media_skips_claimed_row(self, mock_ytdl_class):
+        """Test a row that is no longer pending is not downloaded."""
+        test_url = "https://www.youtube.com/watch?v=test"
+        row_id = self._insert_test_download(test_url, status='downloading')
+
+        with patch('yt_dl_manager.download_utils.config') as mock_config:
+            mock_default_section = MagicMock()
+            mock_default_section.__getitem__.return_value = 'test_downloads'
+            mock_config.__getitem__.return_value = mock_default_section
+
+            status = self.daemon.download_media(row_id, test_url, 0)
+
+        self.assertIsNone(status)
+        mock_ytdl_class.assert_not_called()
+
     @patch('yt_dl_manager.download_utils.yt_dlp.YoutubeDL')
     @patch('builtins.print')
     def test_download_media_failure_max_retries(self, mock_print, mock_ytdl_class):
@@ -282,7 +302,9 @@ class TestYTDLManagerDaemon(unittest.TestCase):
             mock_config.__getitem__.return_value = mock_default_section
 
             # Test download at max retries
-            self.daemon.download_media(row_id, test_url, MAX_RETRIES-1)
+            status = self.daemon.download_media(row_id, test_url, MAX_RETRIES-1)
+
+        self.assertIs(status, DownloadStatus.FAILED)
 
         # Verify database was updated to failed
         conn = sqlite3.connect(self.test_db_path)
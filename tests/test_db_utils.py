@@ -1,11 +1,14 @@
 """Unit tests for db_utils.py module."""
 
+import csv
+import io
 import os
 import json
 import sqlite3
 import tempfile
 import unittest
 from datetime import datetime, timezone
+from unittest.mock import patch
 
 from yt_dl_manager.db_utils import DatabaseUtils
 
@@ -34,6 +37,102 @@ class TestDatabaseUtils(unittest.TestCase):
         conn.close()
         self.assertTrue(table_exists)
 
+    def test_ensure_schema_enables_wal(self):
+        """Test that the database is switched to WAL journal mode."""
+        conn = sqlite3.connect(self.test_db_path)
+        journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+        self.assertEqual(journal_mode, 'wal')
+
+    def test_ensure_schema_survives_busy_journal_switch(self):
+        """Test a failed WAL switch still creates the table and indexes."""
+        real_connect = sqlite3.connect
+
+        class BusyWalConnection:
+            """Connection proxy whose journal_mode switch reports busy."""
+
+            def __init__(self, conn):
+                self.conn = conn
+
+            def execute(self, sql, *args):
+                """Fail the WAL switch and run everything else."""
+                if sql == "PRAGMA journal_mode=WAL":
+                    raise sqlite3.OperationalError("database is locked")
+                return self.conn.execute(sql, *args)
+
+            def __getattr__(self, name):
+                return getattr(self.conn, name)
+
+            def __enter__(self):
+                return self.conn.__enter__()
+
+            def __exit__(self, *exc_info):
+                return self.conn.__exit__(*exc_info)
+
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.close, fd)
+        self.addCleanup(os.unlink, path)
+        with patch('yt_dl_manager.db_utils.sqlite3.connect',
+                   side_effect=lambda *a, **kw: BusyWalConnection(
+                       real_connect(*a, **kw))):
+            db_utils = DatabaseUtils(path)
+        db_utils.close()
+
+        conn = sqlite3.connect(path)
+        try:
+            names = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master")}
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertIn('downloads', names)
+        self.assertIn('ix_downloads_status_req', names)
+        self.assertNotEqual(journal_mode, 'wal')
+
+    def test_ensure_schema_creates_indexes(self):
+        """Test status/timestamp indexes are created and used."""
+        conn = sqlite3.connect(self.test_db_path)
+        try:
+            names = {row[0] for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'")}
+            plan = " ".join(str(row[-1]) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM downloads WHERE status = ? "
+                "ORDER BY timestamp_downloaded DESC LIMIT 10", ('downloaded',)))
+        finally:
+            conn.close()
+        self.assertIn('ix_downloads_status_req', names)
+        self.assertIn('ix_downloads_status_dl', names)
+        self.assertIn('ix_downloads_status_dl', plan)
+
+    def test_readonly_connection(self):
+        """Test a read-only instance sees writes but cannot modify data."""
+        reader = DatabaseUtils(self.test_db_path, readonly=True)
+        try:
+            self.db_utils.add_url("https://example.com/video1")
+            pending = reader.get_downloads_by_status('pending')
+            self.assertEqual(len(pending), 1)
+
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.add_url("https://example.com/video2")
+        finally:
+            reader.close()
+
+    def test_connection_is_reused(self):
+        """Test that queries share one connection until close() is called."""
+        db_utils = DatabaseUtils(self.test_db_path)
+        with patch('yt_dl_manager.db_utils.sqlite3.connect',
+                   wraps=sqlite3.connect) as mock_connect:
+            db_utils.add_url("https://example.com/video1")
+            db_utils.poll_pending()
+            db_utils.queue_length()
+            self.assertEqual(mock_connect.call_count, 0)
+
+            db_utils.close()
+            # The connection is reopened transparently on the next query
+            self.assertEqual(len(db_utils.poll_pending()), 1)
+            self.assertEqual(mock_connect.call_count, 1)
+        db_utils.close()
+
     def test_poll_pending_empty(self):
         """Test polling when no pending downloads exist."""
         result = self.db_utils.poll_pending()
@@ -197,6 +296,30 @@ class TestDatabaseUtils(unittest.TestCase):
         conn.close()
         self.assertEqual(status, "pending")
 
+    def test_retry_download_atomic(self):
+        """Test fused retry increments retries and resets status."""
+        conn = sqlite3.connect(self.test_db_path)
+        cur = conn.cursor()
+        cur.execute(
+            "INSERT INTO downloads (url, status, timestamp_requested, retries) "
+            "VALUES (?, ?, ?, ?)",
+            ("https://test.com", "downloading",
+             datetime.now(timezone.utc).isoformat(), 1)
+        )
+        conn.commit()
+        row_id = cur.lastrowid
+        conn.close()
+
+        self.db_utils.retry_download_atomic(row_id)
+
+        conn = sqlite3.connect(self.test_db_path)
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT status, retries FROM downloads WHERE id = ?", (row_id,))
+        row = cur.fetchone()
+        conn.close()
+        self.assertEqual(row, ("pending", 2))
+
     def test_add_url_new(self):
         """Test adding a new URL."""
         test_url = "https://www.youtube.com/watch?v=test"
@@ -284,6 +407,29 @@ class TestDatabaseUtils(unittest.TestCase):
         self.assertEqual(status['downloaded'], 1)
         self.assertEqual(status['failed'], 1)
 
+    def test_add_urls_bulk(self):
+        """Test bulk insert skips duplicates and invalid URLs."""
+        self.db_utils.add_url("https://example.com/existing")
+
+        added = self.db_utils.add_urls_bulk([
+            "https://example.com/video1",
+            "https://example.com/existing",
+            "ftp://example.com/invalid",
+            "https://example.com/video2",
+            "https://example.com/video1",
+        ])
+
+        self.assertEqual(added, 2)
+        pending = self.db_utils.get_downloads_by_status(
+            'pending', sort_by='id', order='ASC')
+        self.assertEqual(
+            [d['url'] for d in pending],
+            ["https://example.com/existing",
+             "https://example.com/video1",
+             "https://example.com/video2"])
+        self.assertIn('T', pending[1]['timestamp_requested'])
+        self.assertEqual(self.db_utils.add_urls_bulk([]), 0)
+
     def test_get_downloads_by_status(self):
         """Test get_downloads_by_status method."""
         # Add test data with different statuses
@@ -318,6 +464,83 @@ class TestDatabaseUtils(unittest.TestCase):
         self.assertEqual(len(downloads), 1)
         self.assertEqual(downloads[0]['id'], 1)
 
+    def test_get_downloads_by_status_columns(self):
+        """Test get_downloads_by_status projects only the requested columns."""
+        self.db_utils.add_url("https://example.com/video1")
+        self.db_utils.add_url("https://example.com/video2")
+
+        downloads = self.db_utils.get_downloads_by_status(
+            'pending', limit=1, sort_by='id', order='ASC', columns=('id', 'url'))
+        self.assertEqual(len(downloads), 1)
+        self.assertEqual(downloads[0].keys(), ['id', 'url'])
+        self.assertEqual(downloads[0]['url'], "https://example.com/video1")
+
+        downloads = self.db_utils.get_downloads_by_status(
+            'pending', limit=1, sort_by='id', order='ASC',
+            columns=('id', 'url'), as_tuples=True)
+        self.assertEqual(downloads, [(1, "https://example.com/video1")])
+
+        with self.assertRaises(ValueError):
+            self.db_utils.get_downloads_by_status(
+                'pending', columns=('id', 'url; DROP TABLE downloads'))
+
+    def test_get_downloads_by_status_offset(self):
+        """Test get_downloads_by_status pages with limit and offset."""
+        for i in range(1, 6):
+            self.db_utils.add_url(f"https://example.com/video{i}")
+
+        downloads = self.db_utils.get_downloads_by_status(
+            'pending', limit=2, sort_by='id', order='ASC', offset=2)
+        self.assertEqual([d['id'] for d in downloads], [3, 4])
+
+        # Offset is ignored without a limit
+        downloads = self.db_utils.get_downloads_by_status(
+            'pending', sort_by='id', order='ASC', offset=2)
+        self.assertEqual(len(downloads), 5)
+
+    def test_dashboard_fingerprints(self):
+        """Test a status' fingerprint changes only when its rows change."""
+        def fingerprints():
+            return self.db_utils.get_dashboard_snapshot(5)['fingerprints']
+
+        empty = fingerprints()
+        self.assertEqual(empty['pending'][0], 0)
+
+        self.db_utils.add_url("https://example.com/video1")
+        added = fingerprints()
+        self.assertNotEqual(added['pending'], empty['pending'])
+        self.assertEqual(fingerprints(), added)
+
+        self.db_utils.increment_retries(1)
+        retried = fingerprints()
+        self.assertNotEqual(retried['pending'], added['pending'])
+        self.assertEqual(retried['downloaded'], added['downloaded'])
+
+    def test_get_dashboard_snapshot(self):
+        """Test the dashboard snapshot lists only changed statuses."""
+        for i in range(1, 5):
+            self.db_utils.add_url(f"https://example.com/video{i}")
+        self.db_utils.mark_downloading(1)
+        self.db_utils.mark_downloaded(2, "/tmp/video2.mp4", "youtube")
+
+        snapshot = self.db_utils.get_dashboard_snapshot(5, pending_limit=1)
+        self.assertEqual(len(snapshot['pending']), 1)
+        self.assertEqual(len(snapshot['pending'][0]), 5)
+        self.assertEqual([d[0] for d in snapshot['downloading']], [1])
+        # Rows carry only the columns their table renders
+        self.assertEqual(
+            snapshot['downloaded'],
+            [(2, "https://example.com/video2",
+              self.db_utils.get_downloads_by_status('downloaded')[0][
+                  'timestamp_downloaded'],
+              "/tmp/video2.mp4")])
+        self.assertEqual(snapshot['fingerprints']['pending'][0], 2)
+
+        # Statuses whose fingerprint is already known are not listed
+        again = self.db_utils.get_dashboard_snapshot(
+            5, known=snapshot['fingerprints'])
+        self.assertEqual(again, {'fingerprints': snapshot['fingerprints']})
+
     def test_get_downloads_missing_files(self):
         """Test get_downloads_missing_files method."""
         # Add and mark as downloaded with non-existent file
@@ -450,6 +673,31 @@ class TestDatabaseUtils(unittest.TestCase):
         self.assertIn('id,url,status', result)
         self.assertIn('https://example.com/video1', result)
 
+    def test_export_data_to_file_matches_export_data(self):
+        """Test streamed export produces the same output as export_data."""
+        self.db_utils.add_url("https://example.com/video1")
+        self.db_utils.add_url("https://example.com/video2")
+
+        for output_format in ('json', 'csv'):
+            output = io.StringIO()
+            count = self.db_utils.export_data_to_file(output, output_format)
+            self.assertEqual(count, 2)
+
+            rows = [dict(row) for row in self.db_utils.find_downloads_by_url_pattern('')]
+            if output_format == 'json':
+                self.assertEqual(output.getvalue(),
+                                 json.dumps(rows, indent=2, default=str))
+            else:
+                expected = io.StringIO()
+                writer = csv.DictWriter(expected, fieldnames=rows[0].keys())
+                writer.writeheader()
+                writer.writerows(rows)
+                self.assertEqual(output.getvalue(), expected.getvalue())
+
+    def test_export_data_json_empty(self):
+        """Test JSON export with no data is an empty list."""
+        self.assertEqual(json.loads(self.db_utils.export_data('json')), [])
+
     def test_export_data_empty(self):
         """Test export_data method with no data."""
         result = self.db_utils.export_data('csv')
@@ -10,6 +10,9 @@ from yt_dl_manager.i18n import (
     detect_system_locale,
     get_available_languages,
     get_current_language,
+    is_available_language,
+    preload_translations,
+    translation_manager,
 )
 
 
@@ -18,6 +21,12 @@ class TestI18n(unittest.TestCase):
 
     def setUp(self):
         """Set up test environment."""
+        # Restore the global translation state left by earlier code, so a
+        # language switched here does not leak into later tests
+        self.addCleanup(setattr, translation_manager, 'current_translation',
+                        translation_manager.current_translation)
+        self.addCleanup(setattr, translation_manager, 'current_language',
+                        translation_manager.current_language)
         # Reset to English for each test
         setup_translation("en")
 
@@ -28,6 +37,12 @@ class TestI18n(unittest.TestCase):
         self.assertIn("de", languages)
         self.assertEqual(len(languages), 2)
 
+    def test_is_available_language(self):
+        """Test membership checks against the available languages."""
+        self.assertTrue(is_available_language("en"))
+        self.assertTrue(is_available_language("de"))
+        self.assertFalse(is_available_language("fr"))
+
     def test_english_translation(self):
         """Test English translation (identity)."""
         setup_translation("en")
@@ -67,6 +82,18 @@ class TestI18n(unittest.TestCase):
         setup_translation("de")
         self.assertEqual(get_current_language(), "de")
 
+    def test_preload_translations(self):
+        """Test eager loading only happens when no catalog is loaded yet."""
+        translation_manager.current_translation = None
+        preload_translations("de")
+        self.assertEqual(get_current_language(), "de")
+
+        # Already loaded: a second preload must not switch the language
+        preload_translations("en")
+        self.assertEqual(get_current_language(), "de")
+        self.assertEqual(_("Add a video to the queue."),
+                         "Ein Video zur Warteschlange hinzufügen.")
+
     def test_untranslated_string(self):
         """Test that untranslated strings return the original."""
         setup_translation("de")
@@ -196,6 +196,49 @@ class TestMaintenanceCommands(unittest.TestCase):
         ids = [item['id'] for item in pending]
         self.assertIn(1, ids)
 
+    @patch('builtins.print')
+    def test_verify_files_on_disk(self, _):
+        """Test file verification against real files in a directory."""
+        download_dir = tempfile.mkdtemp()
+        existing_file = os.path.join(download_dir, "present.mp4")
+        with open(existing_file, 'w', encoding='utf-8'):
+            pass
+        self.addCleanup(os.rmdir, download_dir)
+        self.addCleanup(os.unlink, existing_file)
+
+        self.maintenance.db.mark_downloaded(1, existing_file, "youtube")
+        self.maintenance.db.mark_downloaded(
+            2, os.path.join(download_dir, "gone.mp4"), "youtube")
+
+        stats = self.maintenance.verify_files()
+
+        self.assertEqual(stats['total_downloaded'], 2)
+        self.assertEqual(stats['files_found'], 1)
+        self.assertEqual(stats['files_missing'], 1)
+
+    @patch('builtins.print')
+    def test_verify_files_broken_symlink(self, _):
+        """Test a broken symlink counts as missing, a working one as found."""
+        download_dir = tempfile.mkdtemp()
+        target = os.path.join(download_dir, "target.mp4")
+        with open(target, 'w', encoding='utf-8'):
+            pass
+        working_link = os.path.join(download_dir, "working.mp4")
+        broken_link = os.path.join(download_dir, "broken.mp4")
+        os.symlink(target, working_link)
+        os.symlink(os.path.join(download_dir, "gone.mp4"), broken_link)
+        self.addCleanup(os.rmdir, download_dir)
+        for path in (target, working_link, broken_link):
+            self.addCleanup(os.unlink, path)
+
+        self.maintenance.db.mark_downloaded(1, working_link, "youtube")
+        self.maintenance.db.mark_downloaded(2, broken_link, "youtube")
+
+        stats = self.maintenance.verify_files()
+
+        self.assertEqual(stats['files_found'], 1)
+        self.assertEqual(stats['files_missing'], 1)
+
     @patch('builtins.print')
     def test_cleanup_database_dry_run(self, mock_print):
         """Test database cleanup in dry run mode."""
@@ -221,6 +264,20 @@ class TestMaintenanceCommands(unittest.TestCase):
         self.assertIn('id,url,status', result)
         self.assertIn('pending', result)
 
+    @patch('builtins.print')
+    def test_export_data_to_output_file(self, _):
+        """Test exporting data streams into the output file."""
+        fd, output_path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+        self.addCleanup(os.unlink, output_path)
+
+        result = self.maintenance.export_data('json', output_file=output_path)
+
+        self.assertIsNone(result)
+        with open(output_path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual([item['url'] for item in data], self.test_urls)
+
     def test_find_downloads_by_url(self):
         """Test finding downloads by URL pattern."""
         matches = self.maintenance.find_downloads_by_url('video1')
@@ -3,6 +3,7 @@
 import unittest
 import tempfile
 import os
+from unittest.mock import patch, MagicMock
 from yt_dl_manager.queue import Queue
 
 
@@ -42,8 +43,6 @@ class TestQueue(unittest.TestCase):
     def test_initialization_default_path(self):
         """Test queue initialization with default database path from config."""
         # Mock config to provide DATABASE_PATH
-        from unittest.mock import patch, MagicMock  # pylint: disable=import-outside-toplevel
-
         with patch('yt_dl_manager.queue.config') as mock_config:
             mock_default_section = MagicMock()
             mock_default_section.__getitem__.return_value = '/test/path/yt_dl_manager.db'
@@ -144,6 +143,21 @@ class TestQueue(unittest.TestCase):
             self.queue.increment_retries("invalid")
         self.assertIn("must be a positive integer", str(context.exception))
 
+    def test_add_urls(self):
+        """Test adding several URLs at once."""
+        added = self.queue.add_urls([
+            "https://www.example.com/video1",
+            "https://www.example.com/video2",
+            "https://www.example.com/video1",
+        ])
+        self.assertEqual(added, 2)
+        self.assertEqual(self.queue.get_queue_length(), 2)
+
+    def test_add_urls_invalid_entry(self):
+        """Test adding URLs with a non-string entry raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.queue.add_urls(["https://www.example.com/video", None])
+
     def test_start_download(self):
         """Test marking a download as started."""
         test_url = "https://www.example.com/video"
@@ -196,6 +210,22 @@ class TestQueue(unittest.TestCase):
         pending_after = self.queue.get_pending()
         self.assertEqual(pending_after[0][2], 1)  # retries should be 1
 
+    def test_retry_download(self):
+        """Test requeueing a download for retry."""
+        self.queue.add_url("https://www.example.com/video")
+        download_id = self.queue.get_pending()[0][0]
+        self.queue.start_download(download_id)
+
+        self.queue.retry_download(download_id)
+        pending_after = self.queue.get_pending()
+        self.assertEqual(pending_after[0][0], download_id)
+        self.assertEqual(pending_after[0][2], 1)
+
+    def test_retry_download_invalid_id(self):
+        """Test retrying with invalid ID raises ValueError."""
+        with self.assertRaises(ValueError):
+            self.queue.retry_download(0)
+
     def test_get_queue_length_empty(self):
         """Test getting queue length when empty."""
         length = self.queue.get_queue_length()
@@ -3,10 +3,30 @@
 import asyncio
 import os
 import tempfile
+import threading
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
-from yt_dl_manager.tui import TUIApp, URLInputModal
+from yt_dl_manager import tui
+from yt_dl_manager.tui import TUIApp, URLInputModal, _format_timestamp, _truncate
+
+STATUSES = ('pending', 'downloading', 'downloaded')
+
+
+def _snapshot(**rows):
+    """Build a dashboard snapshot with unknown fingerprints and the given rows."""
+    return {'fingerprints': dict.fromkeys(STATUSES), **rows}
+
+
+def _run(*awaitables):
+    """Run awaitables one after another on a fresh event loop."""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        for awaitable in awaitables:
+            loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
 
 
 class TestTUIApp(unittest.TestCase):
@@ -17,139 +37,429 @@ class TestTUIApp(unittest.TestCase):
         # Using context manager for resource allocation
         with tempfile.NamedTemporaryFile(delete=False) as temp_file:
             self.db_path = temp_file.name
+        patcher = patch('yt_dl_manager.tui.Queue')
+        self.mock_queue = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.apps = []
 
     def tearDown(self):
         """Clean up test environment."""
+        for app in self.apps:
+            app.ui_state['db_pool'].shutdown()
+            app.ui_state['download_pool'].shutdown()
         if os.path.exists(self.db_path):
             os.unlink(self.db_path)
 
-    @patch('yt_dl_manager.tui.Queue')
-    def test_app_initialization(self, mock_queue_class):
+    def _make_app(self, snapshot=None, **kwargs):
+        """Create a TUIApp whose worker pools are shut down in tearDown."""
+        if snapshot is not None:
+            self.mock_queue.get_dashboard_snapshot.return_value = snapshot
+        app = TUIApp(**kwargs)
+        self.apps.append(app)
+        return app
+
+    @staticmethod
+    def _mock_table(app, *row_keys):
+        """Make every table lookup of app return one mock table."""
+        mock_table = Mock()
+        mock_table.ordered_rows = []
+        mock_table.add_rows.return_value = list(row_keys)
+        mock_table.row_count = len(row_keys)
+        app.query_one = Mock(return_value=mock_table)
+        return mock_table
+
+    def _make_download_app(self):
+        """Create an app with pending download 7 and UI side effects mocked."""
+        app = self._make_app(_snapshot(pending=[
+            (7, 'https://example.com/7', 'pending', '2024-01-01T00:00:00', 1)]))
+        self._mock_table(app, 'key7')
+        app.show_status = AsyncMock()
+        app.set_timer = Mock()
+        return app
+
+    def test_app_initialization(self):
         """Test TUI app initialization."""
-        mock_queue = Mock()
-        mock_queue_class.return_value = mock_queue
-
-        app = TUIApp(recent_limit=5)
+        app = self._make_app(recent_limit=5)
         self.assertEqual(app.recent_limit, 5)
         self.assertIsNotNone(app.queue)
         self.assertIsNotNone(app.logger)
 
-    @patch('yt_dl_manager.tui.Queue')
-    def test_app_initialization_default_limit(self, mock_queue_class):
+    def test_app_initialization_default_limit(self):
         """Test TUI app initialization with default recent limit."""
-        mock_queue = Mock()
-        mock_queue_class.return_value = mock_queue
-
-        app = TUIApp()
+        app = self._make_app()
         self.assertEqual(app.recent_limit, 10)
 
-    @patch('yt_dl_manager.tui.Queue')
-    def test_refresh_pending_downloads_empty(self, mock_queue_class):
-        """Test refreshing pending downloads when queue is empty."""
-        mock_queue = Mock()
-        mock_queue.get_downloads_by_status.return_value = []
-        mock_queue_class.return_value = mock_queue
-
-        app = TUIApp()
-        # Mock the query_one method to return a mock table
-        mock_table = Mock()
-        app.query_one = Mock(return_value=mock_table)
-
-        # Test the method without async context
-        async def test_refresh():
-            await app.refresh_pending_downloads()
+    def test_refresh_data_empty(self):
+        """Test refreshing when the queue is empty."""
+        app = self._make_app(_snapshot(pending=[], downloading=[], downloaded=[]))
+        mock_table = self._mock_table(app)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(test_refresh())
-        finally:
-            loop.close()
+        _run(app.refresh_data())
 
-        mock_table.clear.assert_called_once()
-        mock_queue.get_downloads_by_status.assert_called_once_with(
-            'pending',
-            sort_by='timestamp_requested',
-            order='DESC'
+        mock_table.clear.assert_not_called()
+        mock_table.add_rows.assert_not_called()
+        self.mock_queue.get_dashboard_snapshot.assert_called_once_with(
+            10,
+            pending_limit=200,
+            recent_offset=0,
+            known={'pending': None, 'downloading': None, 'downloaded': None}
         )
 
-    @patch('yt_dl_manager.tui.Queue')
-    def test_refresh_pending_downloads_with_data(self, mock_queue_class):
-        """Test refreshing pending downloads with data."""
-        mock_queue = Mock()
-        test_download = {
-            'id': 1,
-            'url': 'https://example.com/video',
-            'status': 'pending',
-            'timestamp_requested': '2023-01-01T12:00:00',
-            'retries': 0
-        }
-        mock_queue.get_downloads_by_status.return_value = [test_download]
-        mock_queue_class.return_value = mock_queue
-
-        app = TUIApp()
-        mock_table = Mock()
-        mock_table.rows = {"mock_row_key": None}  # Mock rows dict with one entry
-        mock_table.row_count = 1  # Mock row count
-        mock_table.add_row.return_value = "mock_row_key"
-        app.query_one = Mock(return_value=mock_table)
-
-        async def test_refresh():
-            await app.refresh_pending_downloads()
+    def test_refresh_data_pending_rows(self):
+        """Test refreshing renders pending downloads."""
+        # id, url, status, timestamp_requested, retries
+        app = self._make_app(_snapshot(pending=[
+            (1, 'https://example.com/video', 'pending', '2023-01-01T12:00:00', 0)]))
+        mock_table = self._mock_table(app, "mock_row_key")
+        mock_table.ordered_rows = [Mock(key="mock_row_key")]
+        app.batch_update = MagicMock()
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(test_refresh())
-        finally:
-            loop.close()
+        _run(app.refresh_data())
 
-        mock_table.clear.assert_called_once()
-        mock_table.add_row.assert_called_once()
+        mock_table.clear.assert_not_called()
+        mock_table.add_rows.assert_called_once()
         # Verify the row data contains expected values
-        call_args = mock_table.add_row.call_args[0]
-        self.assertEqual(call_args[0], '1')  # ID
-        self.assertEqual(call_args[1], 'https://example.com/video')  # URL
-        self.assertEqual(call_args[2], 'pending')  # Status
-
-    @patch('yt_dl_manager.tui.Queue')
-    def test_refresh_completed_downloads_empty(self, mock_queue_class):
-        """Test refreshing completed downloads when empty."""
-        mock_queue = Mock()
-        mock_queue.get_downloads_by_status.return_value = []
-        mock_queue_class.return_value = mock_queue
-
-        app = TUIApp()
-        mock_table = Mock()
-        app.query_one = Mock(return_value=mock_table)
+        rows = mock_table.add_rows.call_args[0][0]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0][0], '1')  # ID
+        self.assertEqual(rows[0][1], 'https://example.com/video')  # URL
+        self.assertEqual(rows[0][2], 'pending')  # Status
+        self.assertEqual(rows[0][3], '2023-01-01 12:00')  # Requested
+        self.assertEqual(app.ui_state['row_keys']['pending'], {'1': "mock_row_key"})
+        mock_table.sort.assert_not_called()
+        # One batch for the refresh wraps the pending table's own batch
+        self.assertEqual(
+            app.batch_update.return_value.__enter__.call_count, 2)
+
+    def test_refresh_data_diff_update(self):
+        """Test a refresh only touches rows that changed."""
+        def download(row_id, retries=0):
+            return (row_id, f'https://example.com/video{row_id}', 'pending',
+                    '2023-01-01T12:00:00', retries)
+
+        rows = [download(3), download(2, retries=1)]
+        self.mock_queue.get_dashboard_snapshot.side_effect = [
+            {'fingerprints': {'pending': (2,), 'downloading': None,
+                              'downloaded': None}, 'pending': rows},
+            {'fingerprints': {'pending': (3,), 'downloading': None,
+                              'downloaded': None}, 'pending': rows},
+        ]
+
+        app = self._make_app()
+        app.ui_state['column_keys']['pending'] = [
+            'id', 'url', 'status', 'requested', 'retries']
+        app.ui_state['row_keys']['pending'] = {'2': 'key2', '1': 'key1'}
+        app.ui_state['rendered_rows']['pending'] = {
+            '2': ('2', 'https://example.com/video2', 'pending',
+                  '2023-01-01 12:00', '0'),
+            '1': ('1', 'https://example.com/video1', 'pending',
+                  '2023-01-01 12:00', '0'),
+        }
+        mock_table = self._mock_table(app, 'key3')
+        mock_table.row_count = 2
+        mock_table.ordered_rows = [Mock(key='key2'), Mock(key='key3')]
+
+        _run(app.refresh_data())
+
+        mock_table.remove_row.assert_called_once_with('key1')
+        mock_table.update_cell.assert_called_once_with('key2', 'retries', '1')
+        self.assertEqual(mock_table.add_rows.call_args[0][0][0][0], '3')
+        mock_table.sort.assert_called_once()
+        self.assertEqual(app.ui_state['row_keys']['pending'],
+                         {'2': 'key2', '3': 'key3'})
+        self.assertEqual(set(app.ui_state['rendered_rows']['pending']), {'2', '3'})
+        mock_table.get_row.assert_not_called()
+
+        # An unchanged refresh leaves the table alone
+        for mock_method in (mock_table.remove_row, mock_table.update_cell,
+                            mock_table.add_rows, mock_table.sort):
+            mock_method.reset_mock()
+        mock_table.ordered_rows = [Mock(key='key3'), Mock(key='key2')]
+        _run(app.refresh_data())
+        mock_table.remove_row.assert_not_called()
+        mock_table.update_cell.assert_not_called()
+        mock_table.add_rows.assert_not_called()
+        mock_table.sort.assert_not_called()
+
+    def test_refresh_data_uses_dashboard_snapshot(self):
+        """Test refresh_data reads one snapshot and renders changed tables."""
+        fingerprints = {
+            'pending': (1, 1.0, 0.0, '2024-01-01T00:00:00', None),
+            'downloading': (0, 0.0, 0.0, None, None),
+            'downloaded': (0, 0.0, 0.0, None, None),
+        }
+        pending = [(1, 'https://example.com/1', 'pending',
+                    '2024-01-01T00:00:00', 0)]
+        self.mock_queue.get_dashboard_snapshot.side_effect = [
+            {'fingerprints': fingerprints, 'pending': pending,
+             'downloading': [], 'downloaded': []},
+            {'fingerprints': fingerprints, 'pending': pending},
+            {'fingerprints': fingerprints},
+        ]
+
+        app = self._make_app()
+        mock_table = self._mock_table(app, 'key1')
+
+        _run(*(app.refresh_data() for _ in range(3)))
+
+        self.assertEqual(self.mock_queue.get_dashboard_snapshot.call_count, 3)
+        self.mock_queue.get_dashboard_snapshot.assert_called_with(
+            10, pending_limit=200, recent_offset=0, known=fingerprints)
+        self.mock_queue.get_downloads_by_status.assert_not_called()
+        mock_table.add_rows.assert_called_once()
+        self.assertEqual(app.ui_state['row_keys']['pending'], {'1': 'key1'})
+        # Each table widget is looked up once and then reused
+        self.assertEqual(app.query_one.call_count, 3)
+
+    def test_refresh_data_completed_rows(self):
+        """Test refreshing renders completed downloads."""
+        # id, url, timestamp_downloaded, final_filename
+        app = self._make_app(_snapshot(downloaded=[
+            (5, 'https://example.com/5', '2024-01-01T00:00:00', None)]))
+        mock_table = self._mock_table(app, 'key5')
+
+        _run(app.refresh_data())
+
+        mock_table.clear.assert_not_called()
+        mock_table.add_rows.assert_called_once_with(
+            [('5', 'https://example.com/5', '2024-01-01 00:00', 'N/A')])
+
+    def test_refresh_data_completed_window(self):
+        """Test large recent limits read one window of completed rows."""
+        app = self._make_app(_snapshot(downloaded=[]), recent_limit=1000)
+        self._mock_table(app)
+
+        _run(app.refresh_data())
+        # A shifted window is read from its new offset
+        app.ui_state['completed_window']['offset'] = 25
+        _run(app.refresh_data())
+
+        self.assertEqual(
+            [call.kwargs['recent_offset']
+             for call in self.mock_queue.get_dashboard_snapshot.call_args_list],
+            [0, 25])
+        self.mock_queue.get_dashboard_snapshot.assert_called_with(
+            tui.COMPLETED_WINDOW_SIZE,
+            pending_limit=200,
+            recent_offset=25,
+            known={'pending': None, 'downloading': None, 'downloaded': None}
+        )
 
-        async def test_refresh():
-            await app.refresh_completed_downloads()
+    @patch('yt_dl_manager.tui.gettext', side_effect=lambda message: f"T:{message}")
+    def test_texts_translated_once_per_app(self, mock_gettext):
+        """Test headers and templates are translated when the app is built."""
+        app = self._make_app()
+        self.assertEqual(app.ui_state['texts']['refreshed'], "T:🔄 Data refreshed")
+
+        mock_gettext.reset_mock()
+        mock_table = self._mock_table(app)
+        _run(app.setup_tables())
+
+        mock_gettext.assert_not_called()
+        mock_table.add_columns.assert_any_call(
+            "T:ID", "T:URL", "T:Downloaded", "T:File")
+
+    def test_start_download_uses_refreshed_rows(self):
+        """Test starting a download reads the row from the last refresh."""
+        app = self._make_download_app()
+
+        async def refresh_and_start():
+            await app.refresh_data()
+            await app.action_start_download()
+            await asyncio.sleep(0)
+
+        with patch.object(TUIApp, '_start_download_async',
+                          new_callable=AsyncMock) as mock_start:
+            _run(refresh_and_start())
+
+        mock_start.assert_awaited_once_with(7, 'https://example.com/7', 1)
+        self.mock_queue.get_pending.assert_not_called()
+
+    @patch('yt_dl_manager.tui.STATUS_CLEAR_SECONDS', 0.05)
+    def test_status_messages_share_one_clear_task(self):
+        """Test a burst of status messages is cleared by a single task."""
+        app = self._make_app()
+        mock_label = Mock()
+        app.query_one = Mock(return_value=mock_label)
+
+        async def burst():
+            for i in range(3):
+                await app.show_status(f"message {i}")
+            task = app.ui_state['status_task']
+            await app.show_status("last")
+            self.assertIs(app.ui_state['status_task'], task)
+            await task
+
+        _run(burst())
+
+        self.assertEqual(mock_label.update.call_args_list[-2][0][0], "last")
+        mock_label.update.assert_called_with("")
+
+    def test_refresh_skipped_while_paused(self):
+        """Test refresh_data reads nothing while the tables are hidden."""
+        app = self._make_app()
+        self.assertFalse(app.refresh_paused())
+        app.ui_state['suspended'] = True
+        self.assertTrue(app.refresh_paused())
+
+        _run(app.refresh_data())
+
+        self.mock_queue.get_dashboard_snapshot.assert_not_called()
+
+    def test_row_highlight_skips_disabled_debug_logging(self):
+        """Test cursor moves make no debug calls when DEBUG is off."""
+        app = self._make_app()
+        app.logger = Mock()
+        app.logger.isEnabledFor.return_value = False
+        event = Mock()
+        event.data_table.id = "pending-table"
+        event.data_table.get_row.return_value = ["5", "https://example.com/5"]
+
+        _run(app.on_data_table_row_highlighted(event),
+             app.on_data_table_row_selected(event))
+
+        self.assertEqual(app.ui_state['selected_pending_id'], 5)
+        app.logger.debug.assert_not_called()
+
+    def test_reads_run_on_reader_thread(self):
+        """Test database reads run on the dedicated reader thread."""
+        threads = []
+
+        def snapshot(*_args, **_kwargs):
+            threads.append(threading.current_thread().name)
+            return _snapshot()
+
+        self.mock_queue.get_dashboard_snapshot.side_effect = snapshot
+        app = self._make_app()
+
+        _run(app.refresh_data(), app.refresh_data())
+
+        self.assertEqual(len(set(threads)), 1)
+        self.assertTrue(threads[0].startswith('db-read'))
+
+    @patch('yt_dl_manager.tui.download_media')
+    def test_downloads_run_on_download_pool(self, mock_download_media):
+        """Test downloads run on the app's own worker threads."""
+        threads = []
+        mock_download_media.side_effect = (
+            lambda *_args: threads.append(threading.current_thread().name))
+        app = self._make_download_app()
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
         try:
-            loop.run_until_complete(test_refresh())
+            _run(self._start_and_wait(app))
         finally:
-            loop.close()
-
-        mock_table.clear.assert_called_once()
-        mock_queue.get_downloads_by_status.assert_called_once_with(
-            'downloaded',
-            limit=10,
-            sort_by='timestamp_downloaded',
-            order='DESC'
-        )
-
-    def test_status_update_message(self):
-        """Test StatusUpdate message creation."""
-        message = TUIApp.StatusUpdate("Test message")
-        self.assertEqual(message.message, "Test message")
-
-    def test_refresh_data_message(self):
-        """Test RefreshData message creation."""
-        message = TUIApp.RefreshData()
-        self.assertIsNotNone(message)
+            app.on_unmount()
+
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith('dl'))
+        with self.assertRaises(RuntimeError):
+            app.ui_state['download_pool'].submit(print)
+
+    @patch('yt_dl_manager.tui.download_media', return_value=None)
+    def test_lost_claim_is_not_reported_as_completed(self, _):
+        """Test a row claimed elsewhere since the last refresh is not found."""
+        app = self._make_download_app()
+
+        _run(self._start_and_wait(app))
+
+        texts = app.ui_state['texts']
+        app.show_status.assert_awaited_with(texts['not_found'].format(7))
+        self.assertNotIn(((texts['completed'].format(7),),),
+                         app.show_status.await_args_list)
+
+    @staticmethod
+    async def _start_and_wait(app):
+        """Refresh, start the selected download and wait for its task."""
+        await app.refresh_data()
+        await app.action_start_download()
+        await asyncio.gather(*(asyncio.all_tasks() - {asyncio.current_task()}))
+
+    def test_refresh_requests_are_debounced(self):
+        """Test a burst of refresh requests triggers one refresh."""
+        app = self._make_app()
+        app.refresh_data = AsyncMock()
+
+        async def test_burst():
+            for _ in range(3):
+                app.schedule_refresh()
+            await app.ui_state['refresh_task']
+
+        _run(test_burst())
+
+        app.refresh_data.assert_awaited_once()
+        self.assertIsNone(app.ui_state['refresh_task'])
+
+    def test_auto_refresh_delay_adapts(self):
+        """Test auto-refresh delay follows table contents and dirty flag."""
+        app = self._make_app()
+        app.refresh_data = AsyncMock()
+        app.show_status = AsyncMock()
+        app.set_timer = Mock()
+
+        def next_delay():
+            _run(app.action_refresh())
+            return app.set_timer.call_args[0][0]
+
+        self.assertEqual(next_delay(), 10.0)
+        app.ui_state['row_keys']['pending'] = {'1': 'key1'}
+        self.assertEqual(next_delay(), 2.0)
+        app.ui_state['row_keys']['inprogress'] = {'2': 'key2'}
+        self.assertEqual(next_delay(), 0.5)
+
+        # A local change brings the next refresh forward
+        app.ui_state['row_keys']['inprogress'] = {}
+        previous_timer = app.ui_state['refresh_timer']
+        app.mark_dirty()
+        previous_timer.stop.assert_called()
+        self.assertEqual(app.set_timer.call_args[0][0], 0.5)
+
+    def test_format_timestamp(self):
+        """Test timestamp formatting for table display."""
+        self.assertEqual(
+            _format_timestamp('2023-01-01T12:34:56.789+00:00'), '2023-01-01 12:34')
+        self.assertEqual(_format_timestamp('2023-01-01T12:34:56Z'), '2023-01-01 12:34')
+        self.assertEqual(_format_timestamp('not a timestamp'), 'not a timestamp')
+        self.assertEqual(_format_timestamp(None), '')
+        self.assertEqual(_format_timestamp('2023-01-01 12:34:56'), '2023-01-01 12:34')
+        # Compact ISO strings take the datetime parsing path
+        self.assertEqual(_format_timestamp('20230101T123456'), '2023-01-01 12:34')
+
+    def test_truncate(self):
+        """Test truncation keeps short text and caches results."""
+        self.assertEqual(_truncate("short", 10), "short")
+        self.assertEqual(_truncate("a" * 12, 10), "a" * 10 + "...")
+        # A cached call returns the very same string object
+        self.assertIs(_truncate("b" * 12, 10), _truncate("b" * 12, 10))
+
+    def test_format_timestamp_is_cached(self):
+        """Test repeated timestamps are served from the formatter cache."""
+        _format_timestamp.cache_clear()
+        for _ in range(3):
+            _format_timestamp('2024-05-06T07:08:09')
+        self.assertEqual(_format_timestamp.cache_info().hits, 2)
+
+    @patch('yt_dl_manager.tui.asyncio.Runner')
+    @patch('yt_dl_manager.tui.TUIApp')
+    def test_main_uses_uvloop_when_available(self, mock_app_class, mock_runner_class):
+        """Test main() runs on a uvloop loop only when uvloop is installed."""
+        mock_uvloop = Mock()
+        with patch('yt_dl_manager.tui.importlib.import_module',
+                   return_value=mock_uvloop):
+            tui.main(recent_limit=3)
+        mock_runner_class.assert_called_once_with(
+            loop_factory=mock_uvloop.new_event_loop)
+        mock_app = mock_app_class.return_value
+        runner = mock_runner_class.return_value.__enter__.return_value
+        runner.run.assert_called_once_with(mock_app.run_async.return_value)
+        mock_app.run.assert_not_called()
+        mock_app_class.assert_called_once_with(recent_limit=3)
+
+        mock_runner_class.reset_mock()
+        with patch('yt_dl_manager.tui.importlib.import_module',
+                   side_effect=ImportError):
+            tui.main()
+        mock_runner_class.assert_not_called()
+        mock_app.run.assert_called_once()
 
 
 class TestURLInputModal(unittest.TestCase):
@@ -159,6 +469,7 @@ class TestURLInputModal(unittest.TestCase):
         """Set up test environment."""
         self.mock_app = Mock()
         self.mock_app.queue = Mock()
+        self.mock_app.show_status = AsyncMock()
 
     def test_modal_initialization(self):
         """Test modal initialization."""
@@ -177,16 +488,15 @@ class TestURLInputModal(unittest.TestCase):
         async def test_add():
             await modal.add_url_to_queue("https://example.com/video")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(test_add())
-        finally:
-            loop.close()
+        _run(test_add())
 
         mock_queue.add_url.assert_called_once_with("https://example.com/video")
-        # Verify messages were posted
-        self.assertEqual(self.mock_app.post_message.call_count, 2)
+        # Status is shown and a refresh scheduled directly on the app
+        self.mock_app.show_status.assert_awaited_once()
+        self.assertIn("https://example.com/video",
+                      self.mock_app.show_status.await_args.args[0])
+        self.mock_app.schedule_refresh.assert_called_once()
+        self.mock_app.post_message.assert_not_called()
 
     @patch('yt_dl_manager.tui.Queue')
     def test_add_url_failure(self, _):
@@ -200,17 +510,15 @@ class TestURLInputModal(unittest.TestCase):
         async def test_add():
             await modal.add_url_to_queue("https://example.com/duplicate")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(test_add())
-        finally:
-            loop.close()
+        _run(test_add())
 
         mock_queue.add_url.assert_called_once_with(
             "https://example.com/duplicate")
-        # Should post warning message and refresh
-        self.assertEqual(self.mock_app.post_message.call_count, 2)
+        # Should show warning message and refresh
+        self.mock_app.show_status.assert_awaited_once()
+        self.assertIn("URL already exists",
+                      self.mock_app.show_status.await_args.args[0])
+        self.mock_app.schedule_refresh.assert_called_once()
 
     def test_add_url_exception(self):
         """Test URL addition with exception."""
@@ -223,16 +531,12 @@ class TestURLInputModal(unittest.TestCase):
         async def test_add():
             await modal.add_url_to_queue("invalid-url")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        try:
-            loop.run_until_complete(test_add())
-        finally:
-            loop.close()
+        _run(test_add())
 
         mock_queue.add_url.assert_called_once_with("invalid-url")
-        # Should post error message
-        self.mock_app.post_message.assert_called_once()
+        # Should show error message without refreshing
+        self.mock_app.show_status.assert_awaited_once()
+        self.mock_app.schedule_refresh.assert_not_called()
 
 
 if __name__ == '__main__':
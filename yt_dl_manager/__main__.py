@@ -70,7 +70,7 @@ def setup_argument_parser():
         "set", help=_("Set language preference."))
     set_parser.add_argument(
         "language",
-        choices=get_available_languages() + ["auto"],
+        choices=[*get_available_languages(), "auto"],
         help=_("Language code or 'auto' for automatic detection."),
     )
 
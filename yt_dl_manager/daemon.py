@@ -41,9 +41,9 @@ class YTDLManagerDaemon:
         self.queue.increment_retries(row_id)
 
     def download_media(self, row_id, url, retries):
-        """Download media using shared utility."""
-        download_media(self.queue, row_id, url,
-                       retries, max_retries=MAX_RETRIES)
+        """Download media using shared utility, returning the new status."""
+        return download_media(self.queue, row_id, url,
+                              retries, max_retries=MAX_RETRIES)
 
     def run(self):
         """Main loop for polling and processing downloads."""
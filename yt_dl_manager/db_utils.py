@@ -7,6 +7,10 @@ import os
 import json
 import csv
 import io
+import textwrap
+import threading
+import urllib.parse
+from contextlib import contextmanager
 from enum import Enum
 from .config import config
 
@@ -32,6 +36,27 @@ def is_valid_url(url):
     return isinstance(url, str) and url_pattern.match(url.strip())
 
 
+def _select_list(columns):
+    """Build a SELECT column list from whitelisted column names.
+
+    Args:
+        columns (iterable or None): Column names, or None for all columns.
+
+    Returns:
+        str: Comma-separated column names, or '*'.
+
+    Raises:
+        ValueError: If columns is empty or contains an unknown column name.
+    """
+    if columns is None:
+        return "*"
+    columns = tuple(columns)
+    unknown = set(columns) - DOWNLOAD_COLUMNS
+    if unknown or not columns:
+        raise ValueError(f"Invalid columns: {sorted(unknown)}")
+    return ", ".join(columns)
+
+
 # Database schema definition
 DOWNLOADS_TABLE_SCHEMA = '''
 CREATE TABLE IF NOT EXISTS downloads (
@@ -46,9 +71,83 @@ CREATE TABLE IF NOT EXISTS downloads (
 );
 '''
 
-
-class DatabaseUtils:
-    """Centralized database operations for yt-dl-manager."""
+# Indexes serving the status filtered, timestamp ordered listings
+DOWNLOADS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_downloads_status_req "
+    "ON downloads(status, timestamp_requested DESC)",
+    "CREATE INDEX IF NOT EXISTS ix_downloads_status_dl "
+    "ON downloads(status, timestamp_downloaded DESC)",
+)
+
+# Columns callers may project in get_downloads_by_status()
+DOWNLOAD_COLUMNS = frozenset({
+    'id', 'url', 'status', 'timestamp_requested', 'timestamp_downloaded',
+    'final_filename', 'extractor', 'retries'
+})
+
+# Per-connection tuning. WAL lets readers (TUI refresh) run alongside the
+# daemon's writes, and synchronous=NORMAL is safe in WAL mode. A negative
+# cache_size is in KiB, so each connection keeps up to ~20MB of pages.
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+)
+BUSY_TIMEOUT_SECONDS = 30.0
+
+# State transition statements. sqlite3 caches prepared statements by SQL
+# text, so keeping these constant lets every call reuse the parsed form.
+SET_STATUS_SQL = "UPDATE downloads SET status = ? WHERE id = ?"
+CLAIM_PENDING_SQL = "UPDATE downloads SET status = ? WHERE id = ? AND status = ?"
+MARK_DOWNLOADED_SQL = (
+    "UPDATE downloads SET status = ?, timestamp_downloaded = ?, "
+    "final_filename = ?, extractor = ? WHERE id = ?"
+)
+INCREMENT_RETRIES_SQL = "UPDATE downloads SET retries = retries + 1 WHERE id = ?"
+RETRY_DOWNLOAD_SQL = (
+    "UPDATE downloads SET retries = retries + 1, status = ? WHERE id = ?"
+)
+INSERT_URL_SQL = (
+    "INSERT INTO downloads (url, status, timestamp_requested) VALUES (?, ?, ?)"
+)
+INSERT_URL_IGNORE_SQL = (
+    "INSERT OR IGNORE INTO downloads (url, status, timestamp_requested) "
+    "VALUES (?, ?, ?)"
+)
+
+# Statuses shown on the TUI dashboard and the column each is listed by,
+# newest first, plus the columns its table renders, in display order
+DASHBOARD_ORDER = {
+    DownloadStatus.PENDING.value: 'timestamp_requested',
+    DownloadStatus.DOWNLOADING.value: 'timestamp_requested',
+    DownloadStatus.DOWNLOADED.value: 'timestamp_downloaded',
+}
+DASHBOARD_COLUMNS = {
+    DownloadStatus.PENDING.value: (
+        'id', 'url', 'status', 'timestamp_requested', 'retries'),
+    DownloadStatus.DOWNLOADING.value: (
+        'id', 'url', 'status', 'timestamp_requested', 'retries'),
+    DownloadStatus.DOWNLOADED.value: (
+        'id', 'url', 'timestamp_downloaded', 'final_filename'),
+}
+# A status' fingerprint is (count, id total, retries total, latest requested
+# timestamp, latest downloaded timestamp); it changes whenever rows enter or
+# leave the status, are retried or get new timestamps
+STATUS_FINGERPRINTS_SQL = (
+    "SELECT status, COUNT(*), TOTAL(id), TOTAL(retries), "
+    "MAX(timestamp_requested), MAX(timestamp_downloaded) "
+    "FROM downloads WHERE status IN (?, ?, ?) GROUP BY status"
+)
+# Fingerprint of a status with no rows
+EMPTY_FINGERPRINT = (0, 0.0, 0.0, None, None)
+
+
+class _QueueDatabase:
+    """Connection handling and the queue operations of DatabaseUtils.
+
+    A single connection is opened lazily and reused for all queries. It may
+    be shared between threads; access is serialized through a lock.
+    """
 
     def _build_in_clause_placeholders(self, count):
         """Build a safe IN clause with the specified number of placeholders.
@@ -66,38 +165,89 @@ class DatabaseUtils:
         Sets status to 'downloading' only if current status is 'pending'.
         Returns True if claim succeeded, False otherwise.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE downloads SET status = ? "
-            "WHERE id = ? AND status = ?",
-            (DownloadStatus.DOWNLOADING.value,
-             row_id,
-             DownloadStatus.PENDING.value))
-        updated = cur.rowcount
-        conn.commit()
-        conn.close()
-        return updated == 1
-
-    def __init__(self, db_path=None):
+        with self._transaction() as conn:
+            cur = conn.execute(
+                CLAIM_PENDING_SQL,
+                (DownloadStatus.DOWNLOADING.value,
+                 row_id,
+                 DownloadStatus.PENDING.value))
+            return cur.rowcount == 1
+
+    def __init__(self, db_path=None, readonly=False):
         """Initialize DatabaseUtils with database path.
         Args:
             db_path (str, optional): Path to the SQLite database file. Defaults to None.
+            readonly (bool): Open the database read-only. The schema is not
+                created, so the database must already exist.
         """
         self.db_path = db_path if db_path else config['DEFAULT']['database_path']
-        self._ensure_schema()
+        self.readonly = readonly
+        self._conn = None
+        self._lock = threading.RLock()
+        if not readonly:
+            self._ensure_schema()
+
+    def _connection(self):
+        """Return the shared connection, opening it on first use.
+        Returns:
+            sqlite3.Connection: Connection with the tuning PRAGMAs applied.
+        """
+        if self._conn is None:
+            if self.readonly:
+                path = urllib.parse.quote(os.path.abspath(self.db_path))
+                uri = f"file:{path}?mode=ro"
+                conn = sqlite3.connect(uri, uri=True, timeout=BUSY_TIMEOUT_SECONDS,
+                                       check_same_thread=False)
+            else:
+                conn = sqlite3.connect(self.db_path, timeout=BUSY_TIMEOUT_SECONDS,
+                                       check_same_thread=False)
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            self._conn = conn
+        return self._conn
+
+    @contextmanager
+    def _transaction(self):
+        """Hold the lock and yield the connection.
+        Commits when the block succeeds and rolls back if it raises.
+        """
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                yield conn
+
+    def close(self):
+        """Close the shared connection, refreshing planner statistics first."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute("PRAGMA optimize")
+            except sqlite3.Error:
+                pass
+            finally:
+                self._conn.close()
+                self._conn = None
 
     def _ensure_schema(self):
-        """Create or verify the downloads table schema.
+        """Create or verify the downloads table schema and its indexes.
         Raises:
             sqlite3.OperationalError: If database connection fails during setup.
         """
+        if self.db_path != ':memory:':
+            try:
+                with self._transaction() as conn:
+                    # journal_mode is stored in the database file, set it once
+                    conn.execute("PRAGMA journal_mode=WAL")
+            except sqlite3.OperationalError:
+                # Keep the current journal mode if the file is busy, but
+                # still create the schema below
+                pass
         try:
-            conn = sqlite3.connect(self.db_path)
-            cur = conn.cursor()
-            cur.execute(DOWNLOADS_TABLE_SCHEMA)
-            conn.commit()
-            conn.close()
+            with self._transaction() as conn:
+                conn.execute(DOWNLOADS_TABLE_SCHEMA)
+                for index in DOWNLOADS_INDEXES:
+                    conn.execute(index)
         except sqlite3.OperationalError:
             pass
 
@@ -106,29 +256,23 @@ class DatabaseUtils:
         Returns:
             list: List of tuples (id, url, retries) for pending downloads.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT id, url, retries FROM downloads WHERE status = ?",
-            (DownloadStatus.PENDING.value,)
-        )
-        rows = cur.fetchall()
-        conn.close()
-        return rows
+        with self._transaction() as conn:
+            cur = conn.execute(
+                "SELECT id, url, retries FROM downloads WHERE status = ?",
+                (DownloadStatus.PENDING.value,)
+            )
+            return cur.fetchall()
 
     def mark_downloading(self, row_id):
         """Mark a download as 'downloading' in the database.
         Args:
             row_id (int): The database row ID of the download.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE downloads SET status = ? WHERE id = ?",
-            (DownloadStatus.DOWNLOADING.value, row_id)
-        )
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute(
+                SET_STATUS_SQL,
+                (DownloadStatus.DOWNLOADING.value, row_id)
+            )
 
     def mark_downloaded(self, row_id, filename, extractor):
         """Mark a download as 'downloaded' and store metadata in the database.
@@ -138,58 +282,57 @@ class DatabaseUtils:
             extractor (str): The extractor used for the download.
         """
         # Store the full filename path for file existence checks
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE downloads SET status = ?, "
-            "timestamp_downloaded = ?, "
-            "final_filename = ?, extractor = ? WHERE id = ?",
-            (DownloadStatus.DOWNLOADED.value,
-             datetime.datetime.now(datetime.timezone.utc).isoformat(),
-             filename, extractor, row_id)
-        )
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute(
+                MARK_DOWNLOADED_SQL,
+                (DownloadStatus.DOWNLOADED.value,
+                 datetime.datetime.now(datetime.timezone.utc).isoformat(),
+                 filename, extractor, row_id)
+            )
 
     def mark_failed(self, row_id):
         """Mark a download as 'failed' in the database.
         Args:
             row_id (int): The database row ID of the download.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE downloads SET status = ? WHERE id = ?",
-            (DownloadStatus.FAILED.value, row_id)
-        )
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute(
+                SET_STATUS_SQL,
+                (DownloadStatus.FAILED.value, row_id)
+            )
 
     def increment_retries(self, row_id):
         """Increment the retry counter for a download in the database.
         Args:
             row_id (int): The database row ID of the download.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE downloads SET retries = retries + 1 WHERE id = ?", (row_id,))
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute(INCREMENT_RETRIES_SQL, (row_id,))
 
     def set_status_to_pending(self, row_id):
         """Set a download status back to 'pending' for retry.
         Args:
             row_id (int): The database row ID of the download.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "UPDATE downloads SET status = ? WHERE id = ?",
-            (DownloadStatus.PENDING.value, row_id)
-        )
-        conn.commit()
-        conn.close()
+        with self._transaction() as conn:
+            conn.execute(
+                SET_STATUS_SQL,
+                (DownloadStatus.PENDING.value, row_id)
+            )
+
+    def retry_download_atomic(self, row_id):
+        """Increment the retry counter and reset status to 'pending' at once.
+
+        Both changes are made by a single UPDATE in one transaction, so
+        readers never see the incremented counter alongside a stale status.
+        Args:
+            row_id (int): The database row ID of the download.
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                RETRY_DOWNLOAD_SQL,
+                (DownloadStatus.PENDING.value, row_id)
+            )
 
     def add_url(self, media_url):
         """Add a media URL to the downloads queue.
@@ -203,27 +346,23 @@ class DatabaseUtils:
         if not is_valid_url(media_url):
             return False, "Invalid URL. Only http(s) URLs are allowed.", None
 
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        try:
-            cur.execute(
-                "INSERT INTO downloads (url, status, timestamp_requested) "
-                "VALUES (?, ?, ?)",
-                (
-                    media_url,
-                    DownloadStatus.PENDING.value,
-                    datetime.datetime.now(
-                        datetime.timezone.utc
-                    ).isoformat(),
-                ),
-            )
-            conn.commit()
-            row_id = cur.lastrowid
-            return True, f"URL added to queue: {media_url}", row_id
-        except sqlite3.IntegrityError:
-            cur.execute(
-                "SELECT id, final_filename, status FROM downloads WHERE url = ?", (media_url,))
-            row = cur.fetchone()
+        with self._transaction() as conn:
+            try:
+                cur = conn.execute(
+                    INSERT_URL_SQL,
+                    (
+                        media_url,
+                        DownloadStatus.PENDING.value,
+                        datetime.datetime.now(
+                            datetime.timezone.utc
+                        ).isoformat(),
+                    ),
+                )
+                return True, f"URL added to queue: {media_url}", cur.lastrowid
+            except sqlite3.IntegrityError:
+                row = conn.execute(
+                    "SELECT id, final_filename, status FROM downloads WHERE url = ?",
+                    (media_url,)).fetchone()
             if row:
                 row_id, filename, status = row
                 if filename:
@@ -237,20 +376,102 @@ class DatabaseUtils:
             # Edge case: IntegrityError but no row found - should not normally happen
             message = f"URL already exists in queue: {media_url}"
             return False, message, None
-        finally:
-            conn.close()
+
+    def add_urls_bulk(self, urls):
+        """Add several media URLs to the downloads queue in one transaction.
+
+        Invalid URLs are skipped and URLs already in the queue are ignored.
+        Args:
+            urls (iterable): The URLs to add to the queue.
+        Returns:
+            int: Number of URLs newly added.
+        """
+        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        params = [(url, DownloadStatus.PENDING.value, timestamp)
+                  for url in urls if is_valid_url(url)]
+        if not params:
+            return 0
+        with self._transaction() as conn:
+            return conn.executemany(INSERT_URL_IGNORE_SQL, params).rowcount
 
     def queue_length(self):
         """Return the number of items in the queue.
         Returns:
             int: Total number of downloads in the database.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT COUNT(*) FROM downloads")
-        count = cur.fetchone()[0]
-        conn.close()
-        return count
+        with self._transaction() as conn:
+            return conn.execute("SELECT COUNT(*) FROM downloads").fetchone()[0]
+
+    def get_dashboard_snapshot(self, recent_limit, pending_limit=None,
+                               recent_offset=0, known=None):
+        """Read what the TUI dashboard shows in a single transaction.
+
+        Fingerprints of the pending, downloading and downloaded statuses
+        come from one grouped query. Listings are then read, as one
+        UNION ALL, only for the statuses whose fingerprint differs from
+        the one the caller already displays.
+
+        Args:
+            recent_limit (int): Maximum number of downloaded rows.
+            pending_limit (int, optional): Maximum number of pending rows;
+                all when None.
+            recent_offset (int): Number of downloaded rows to skip.
+            known (dict, optional): Fingerprints already displayed, by status.
+
+        Returns:
+            dict: 'fingerprints' maps each status to its fingerprint, and
+            each changed status maps to its rows, newest first, as tuples
+            of that status' DASHBOARD_COLUMNS.
+        """
+        known = known or {}
+        pages = {
+            DownloadStatus.PENDING.value: (pending_limit, 0),
+            DownloadStatus.DOWNLOADING.value: (None, 0),
+            DownloadStatus.DOWNLOADED.value: (recent_limit, recent_offset),
+        }
+        with self._transaction() as conn:
+            fingerprints = dict.fromkeys(DASHBOARD_ORDER, EMPTY_FINGERPRINT)
+            for row in conn.execute(STATUS_FINGERPRINTS_SQL,
+                                    tuple(DASHBOARD_ORDER)):
+                fingerprints[row[0]] = tuple(row[1:])
+            changed = {status: page for status, page in pages.items()
+                       if fingerprints[status] != known.get(status)}
+            snapshot = {'fingerprints': fingerprints}
+            snapshot.update(self._read_dashboard_rows(conn, changed))
+        return snapshot
+
+    def _read_dashboard_rows(self, conn, pages):
+        """Read several status listings with one UNION ALL query.
+
+        Args:
+            conn (sqlite3.Connection): Connection of the open transaction.
+            pages (dict): (limit, offset) by status; None means no limit.
+
+        Returns:
+            dict: Rows as tuples of DASHBOARD_COLUMNS by status, newest first.
+        """
+        rows = {status: [] for status in pages}
+        if not pages:
+            return rows
+
+        # Every arm must return the same number of columns, so narrower
+        # projections are padded with NULLs and cut off again below. Each
+        # arm keeps its own ORDER BY/LIMIT inside a subquery.
+        width = max(len(columns) for columns in DASHBOARD_COLUMNS.values())
+        arms, params = [], []
+        for status, (limit, offset) in pages.items():
+            columns = DASHBOARD_COLUMNS[status]
+            padding = ", NULL" * (width - len(columns))
+            arms.append(
+                f"SELECT * FROM (SELECT status, {_select_list(columns)}{padding} "
+                f"FROM downloads WHERE status = ? "
+                f"ORDER BY {DASHBOARD_ORDER[status]} DESC LIMIT ? OFFSET ?)")
+            # A negative LIMIT means no limit in SQLite
+            params.extend((status, -1 if limit is None else limit, offset))
+
+        for row in conn.execute(" UNION ALL ".join(arms), params):
+            rows[row[0]].append(row[1:len(DASHBOARD_COLUMNS[row[0]]) + 1])
+        return rows
 
     def get_queue_status(self):
         """Get queue statistics by status.
@@ -262,15 +483,12 @@ class DatabaseUtils:
             sqlite3.OperationalError: If database connection or query fails.
         """
         try:
-            conn = sqlite3.connect(self.db_path)
-            cur = conn.cursor()
-            cur.execute("""
-                SELECT status, COUNT(*)
-                FROM downloads
-                GROUP BY status
-            """)
-            results = cur.fetchall()
-            conn.close()
+            with self._transaction() as conn:
+                results = conn.execute("""
+                    SELECT status, COUNT(*)
+                    FROM downloads
+                    GROUP BY status
+                """).fetchall()
 
             # Initialize all possible statuses with 0
             status_counts = {
@@ -290,8 +508,16 @@ class DatabaseUtils:
             raise sqlite3.OperationalError(
                 f"Failed to get queue status: {e}") from e
 
+
+class DatabaseUtils(_QueueDatabase):
+    """Centralized database operations for yt-dl-manager.
+
+    Adds the listing and maintenance operations to the queue operations
+    inherited from _QueueDatabase.
+    """
+
     def get_downloads_by_status(self, status, limit=None, sort_by='timestamp_requested',
-                                order='DESC', **filters):
+                                order='DESC', **options):
         """Get downloads filtered by status with optional filters.
 
         Args:
@@ -299,26 +525,30 @@ class DatabaseUtils:
             limit (int, optional): Maximum number of results.
             sort_by (str): Field to sort by (timestamp_requested, retries, url, id).
             order (str): Sort order (ASC, DESC).
-            **filters: Additional filters (retry_count, extractor).
+            **options: Projection and paging (columns to select, all when
+                None; offset, rows to skip, requires limit; as_tuples, return
+                plain tuples in column order) plus additional filters
+                (retry_count, extractor).
 
         Returns:
-            list: List of download records as dictionaries.
-        """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row  # Enable column access by name
-        cur = conn.cursor()
+            list: List of download records as sqlite3.Row objects, or as
+            tuples when as_tuples is set.
 
+        Raises:
+            ValueError: If columns contains an unknown column name.
+        """
         # Build query with filters
-        query = "SELECT * FROM downloads WHERE status = ?"
+        query = (f"SELECT {_select_list(options.get('columns'))} "
+                 "FROM downloads WHERE status = ?")
         params = [status]
 
-        if 'retry_count' in filters and filters['retry_count'] is not None:
+        if options.get('retry_count') is not None:
             query += " AND retries = ?"
-            params.append(filters['retry_count'])
+            params.append(options['retry_count'])
 
-        if 'extractor' in filters and filters['extractor']:
+        if options.get('extractor'):
             query += " AND extractor = ?"
-            params.append(filters['extractor'])
+            params.append(options['extractor'])
 
         # Validate sort field using safe mapping
         valid_sort_fields = {
@@ -331,22 +561,24 @@ class DatabaseUtils:
         }
         safe_sort_by = valid_sort_fields.get(sort_by, 'timestamp_requested')
 
-        # Validate order using safe mapping
-        valid_orders = {'ASC': 'ASC', 'DESC': 'DESC'}
-        safe_order = valid_orders.get(order.upper(), 'DESC')
+        # Validate order, defaulting to DESC
+        safe_order = 'ASC' if order.upper() == 'ASC' else 'DESC'
 
         query += f" ORDER BY {safe_sort_by} {safe_order}"
 
         if limit:
             query += " LIMIT ?"
             params.append(limit)
+            if options.get('offset'):
+                query += " OFFSET ?"
+                params.append(options['offset'])
 
-        cur.execute(query, params)
-        rows = cur.fetchall()
-        conn.close()
-
-        # Convert to list of dictionaries
-        return [dict(row) for row in rows]
+        with self._transaction() as conn:
+            if options.get('as_tuples'):
+                return conn.execute(query, params).fetchall()
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row  # Enable column access by name
+            return cur.execute(query, params).fetchall()
 
     def get_downloads_missing_files(self):
         """Get downloaded items where the file no longer exists.
@@ -354,24 +586,16 @@ class DatabaseUtils:
         Returns:
             list: List of download records with missing files.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        cur.execute("""
-            SELECT * FROM downloads 
-            WHERE status = ? AND final_filename IS NOT NULL
-        """, (DownloadStatus.DOWNLOADED.value,))
-
-        rows = cur.fetchall()
-        conn.close()
-
-        missing_files = []
-        for row in rows:
-            if not os.path.exists(row['final_filename']):
-                missing_files.append(dict(row))
+        with self._transaction() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            rows = cur.execute("""
+                SELECT * FROM downloads
+                WHERE status = ? AND final_filename IS NOT NULL
+            """, (DownloadStatus.DOWNLOADED.value,)).fetchall()
 
-        return missing_files
+        return [row for row in rows
+                if not os.path.exists(row['final_filename'])]
 
     def remove_downloads_by_status(self, status, older_than_days=None, dry_run=False):
         """Remove downloads by status with optional age filter.
@@ -384,9 +608,6 @@ class DatabaseUtils:
         Returns:
             int: Number of items that would be/were removed.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-
         query = "SELECT COUNT(*) FROM downloads WHERE status = ?"
         params = [status]
 
@@ -396,15 +617,13 @@ class DatabaseUtils:
             query += " AND timestamp_requested < ?"
             params.append(cutoff_date)
 
-        cur.execute(query, params)
-        count = cur.fetchone()[0]
+        with self._transaction() as conn:
+            count = conn.execute(query, params).fetchone()[0]
 
-        if not dry_run and count > 0:
-            delete_query = query.replace("SELECT COUNT(*)", "DELETE")
-            cur.execute(delete_query, params)
-            conn.commit()
+            if not dry_run and count > 0:
+                delete_query = query.replace("SELECT COUNT(*)", "DELETE")
+                conn.execute(delete_query, params)
 
-        conn.close()
         return count
 
     def remove_downloads_by_ids(self, download_ids, dry_run=False):
@@ -420,25 +639,20 @@ class DatabaseUtils:
         if not download_ids:
             return 0
 
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-
         placeholders = self._build_in_clause_placeholders(len(download_ids))
 
         # Use string concatenation instead of f-string for SQL
         query = "SELECT COUNT(*) FROM downloads WHERE id IN (" + \
             placeholders + ")"
 
-        cur.execute(query, download_ids)
-        count = cur.fetchone()[0]
+        with self._transaction() as conn:
+            count = conn.execute(query, download_ids).fetchone()[0]
 
-        if not dry_run and count > 0:
-            delete_query = "DELETE FROM downloads WHERE id IN (" + \
-                placeholders + ")"
-            cur.execute(delete_query, download_ids)
-            conn.commit()
+            if not dry_run and count > 0:
+                delete_query = "DELETE FROM downloads WHERE id IN (" + \
+                    placeholders + ")"
+                conn.execute(delete_query, download_ids)
 
-        conn.close()
         return count
 
     def remove_downloads_by_url_pattern(self, url_pattern, dry_run=False):
@@ -451,19 +665,14 @@ class DatabaseUtils:
         Returns:
             int: Number of items that would be/were removed.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-
         query = "SELECT COUNT(*) FROM downloads WHERE url LIKE ?"
-        cur.execute(query, [f"%{url_pattern}%"])
-        count = cur.fetchone()[0]
+        with self._transaction() as conn:
+            count = conn.execute(query, [f"%{url_pattern}%"]).fetchone()[0]
 
-        if not dry_run and count > 0:
-            delete_query = "DELETE FROM downloads WHERE url LIKE ?"
-            cur.execute(delete_query, [f"%{url_pattern}%"])
-            conn.commit()
+            if not dry_run and count > 0:
+                delete_query = "DELETE FROM downloads WHERE url LIKE ?"
+                conn.execute(delete_query, [f"%{url_pattern}%"])
 
-        conn.close()
         return count
 
     def reset_downloads_to_pending(self, download_ids, reset_retries=True):
@@ -479,9 +688,6 @@ class DatabaseUtils:
         if not download_ids:
             return 0
 
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-
         placeholders = self._build_in_clause_placeholders(len(download_ids))
 
         if reset_retries:
@@ -496,11 +702,8 @@ class DatabaseUtils:
                      "WHERE id IN (" + placeholders + ")")
             params = [DownloadStatus.PENDING.value] + download_ids
 
-        cur.execute(query, params)
-        updated = cur.rowcount
-        conn.commit()
-        conn.close()
-        return updated
+        with self._transaction() as conn:
+            return conn.execute(query, params).rowcount
 
     def find_downloads_by_url_pattern(self, url_pattern):
         """Find downloads matching a URL pattern.
@@ -511,16 +714,11 @@ class DatabaseUtils:
         Returns:
             list: List of matching download records.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        cur.execute("SELECT * FROM downloads WHERE url LIKE ?",
-                    [f"%{url_pattern}%"])
-        rows = cur.fetchall()
-        conn.close()
-
-        return [dict(row) for row in rows]
+        with self._transaction() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            return cur.execute("SELECT * FROM downloads WHERE url LIKE ?",
+                               [f"%{url_pattern}%"]).fetchall()
 
     def cleanup_database(self, dry_run=False):
         """Perform database maintenance operations.
@@ -531,47 +729,50 @@ class DatabaseUtils:
         Returns:
             dict: Statistics about cleanup operations.
         """
-        conn = sqlite3.connect(self.db_path)
-        cur = conn.cursor()
-
         stats = {
             'orphaned_records': 0,
             'space_saved_kb': 0,
             'vacuum_performed': False
         }
 
-        # Check for orphaned records (basic integrity check)
-        cur.execute(
-            "SELECT COUNT(*) FROM downloads WHERE url IS NULL OR url = ''")
-        orphaned_count = cur.fetchone()[0]
-        stats['orphaned_records'] = orphaned_count
-
-        if not dry_run:
-            # Remove orphaned records
-            if orphaned_count > 0:
-                cur.execute(
-                    "DELETE FROM downloads WHERE url IS NULL OR url = ''")
-                conn.commit()
-
-            # Get database size before vacuum
-            cur.execute("PRAGMA page_count")
-            pages_before = cur.fetchone()[0]
-            cur.execute("PRAGMA page_size")
-            page_size = cur.fetchone()[0]
-            size_before = pages_before * page_size
-
-            # Vacuum database
-            cur.execute("VACUUM")
-
-            # Get database size after vacuum
-            cur.execute("PRAGMA page_count")
-            pages_after = cur.fetchone()[0]
-            size_after = pages_after * page_size
-
-            stats['space_saved_kb'] = (size_before - size_after) // 1024
-            stats['vacuum_performed'] = True
-
-        conn.close()
+        with self._transaction() as conn:
+            cur = conn.cursor()
+
+            # Check for orphaned records (basic integrity check)
+            cur.execute(
+                "SELECT COUNT(*) FROM downloads WHERE url IS NULL OR url = ''")
+            orphaned_count = cur.fetchone()[0]
+            stats['orphaned_records'] = orphaned_count
+
+            if not dry_run:
+                # Remove orphaned records
+                if orphaned_count > 0:
+                    cur.execute(
+                        "DELETE FROM downloads WHERE url IS NULL OR url = ''")
+                    # VACUUM cannot run inside a transaction
+                    conn.commit()
+
+                # Get database size before vacuum
+                cur.execute("PRAGMA page_count")
+                pages_before = cur.fetchone()[0]
+                cur.execute("PRAGMA page_size")
+                page_size = cur.fetchone()[0]
+                size_before = pages_before * page_size
+
+                # Vacuum database
+                cur.execute("VACUUM")
+
+                # Get database size after vacuum
+                cur.execute("PRAGMA page_count")
+                pages_after = cur.fetchone()[0]
+                size_after = pages_after * page_size
+
+                stats['space_saved_kb'] = (size_before - size_after) // 1024
+                stats['vacuum_performed'] = True
+
+                # Refresh query planner statistics
+                cur.execute("PRAGMA optimize")
+
         return stats
 
     def export_data(self, output_format='json', status_filter=None):
@@ -584,35 +785,54 @@ class DatabaseUtils:
         Returns:
             str: Formatted data string.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        if status_filter:
-            cur.execute("SELECT * FROM downloads WHERE status = ? ORDER BY id",
-                        [status_filter])
-        else:
-            cur.execute("SELECT * FROM downloads ORDER BY id")
+        output = io.StringIO()
+        self.export_data_to_file(output, output_format, status_filter)
+        return output.getvalue()
 
-        rows = cur.fetchall()
-        conn.close()
+    def export_data_to_file(self, fp, output_format='json', status_filter=None):
+        """Stream queue data to an open text file row by row.
 
-        data = [dict(row) for row in rows]
+        Produces the same output as export_data() without holding the
+        whole export in memory.
 
-        if output_format.lower() == 'json':
-            return json.dumps(data, indent=2, default=str)
-
-        if output_format.lower() == 'csv':
-            if not data:
-                return ""
+        Args:
+            fp: Writable text file object.
+            output_format (str): Export format ('json' or 'csv').
+            status_filter (str, optional): Only export downloads with this status.
 
-            output = io.StringIO()
-            writer = csv.DictWriter(output, fieldnames=data[0].keys())
-            writer.writeheader()
-            writer.writerows(data)
-            return output.getvalue()
+        Returns:
+            int: Number of exported records.
+        """
+        output_format = output_format.lower()
+        if output_format not in ('json', 'csv'):
+            raise ValueError("output_format must be 'json' or 'csv'")
 
-        raise ValueError("output_format must be 'json' or 'csv'")
+        with self._transaction() as conn:
+            cur = conn.cursor()
+            if status_filter:
+                cur.execute("SELECT * FROM downloads WHERE status = ? ORDER BY id",
+                            [status_filter])
+            else:
+                cur.execute("SELECT * FROM downloads ORDER BY id")
+            columns = [description[0] for description in cur.description]
+
+            count = 0
+            if output_format == 'json':
+                for row in cur:
+                    fp.write('[\n' if count == 0 else ',\n')
+                    record = json.dumps(dict(zip(columns, row)),
+                                        indent=2, default=str)
+                    fp.write(textwrap.indent(record, '  '))
+                    count += 1
+                fp.write('\n]' if count else '[]')
+            else:
+                writer = csv.writer(fp)
+                for row in cur:
+                    if count == 0:
+                        writer.writerow(columns)
+                    writer.writerow(row)
+                    count += 1
+        return count
 
     def get_storage_usage_summary(self):
         """Get storage usage summary for downloaded files.
@@ -620,17 +840,13 @@ class DatabaseUtils:
         Returns:
             dict: Storage statistics.
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cur = conn.cursor()
-
-        cur.execute("""
-            SELECT final_filename FROM downloads 
-            WHERE status = ? AND final_filename IS NOT NULL
-        """, (DownloadStatus.DOWNLOADED.value,))
-
-        rows = cur.fetchall()
-        conn.close()
+        with self._transaction() as conn:
+            cur = conn.cursor()
+            cur.row_factory = sqlite3.Row
+            rows = cur.execute("""
+                SELECT final_filename FROM downloads
+                WHERE status = ? AND final_filename IS NOT NULL
+            """, (DownloadStatus.DOWNLOADED.value,)).fetchall()
 
         total_size = 0
         files_found = 0
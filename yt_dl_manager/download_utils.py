@@ -3,12 +3,19 @@
 import logging
 import yt_dlp
 from .config import config
+from .db_utils import DownloadStatus
 
 logger = logging.getLogger(__name__)
 
 
 def download_media(queue, row_id, url, retries, max_retries=3):
-    """Download media using yt-dlp, update database, and handle retries."""
+    """Download media using yt-dlp, update database, and handle retries.
+
+    Returns:
+        DownloadStatus: The row's new status (DOWNLOADED, PENDING when
+        requeued for a retry, or FAILED), or None when the row could not be
+        claimed because it is no longer pending.
+    """
     target_folder = config['DEFAULT']['target_folder']
     ydl_opts = {
         'format': 'bestvideo+bestaudio/best',
@@ -22,7 +29,7 @@ def download_media(queue, row_id, url, retries, max_retries=3):
         logger.info(
             "Skipping download for row %s: already being processed.",
             row_id)
-        return
+        return None
     try:
         with yt_dlp.YoutubeDL(ydl_opts) as ydl:
             info = ydl.extract_info(url, download=True)
@@ -31,18 +38,20 @@ def download_media(queue, row_id, url, retries, max_retries=3):
         queue.complete_download(row_id, filename, extractor)
         logger.info("Downloaded: %s", filename)
         print(f"Downloaded: {filename}")  # Keep user-visible output for CLI
+        return DownloadStatus.DOWNLOADED
     except yt_dlp.utils.DownloadError as err:
-        queue.increment_retries(row_id)
         if retries + 1 >= max_retries:
+            queue.increment_retries(row_id)
             queue.fail_download(row_id)
             error_msg = f"Download failed for {url} after {max_retries} attempts: {err}"
             logger.error(error_msg)
             print(error_msg)  # Also print for daemon output
-        else:
-            queue.set_status_to_pending(row_id)
-            retry_msg = (
-                f"Download failed for {url}, will retry "
-                f"(attempt {retries + 1}/{max_retries}): {err}"
-            )
-            logger.warning(retry_msg)
-            print(retry_msg)  # Also print for daemon output
+            return DownloadStatus.FAILED
+        queue.retry_download(row_id)
+        retry_msg = (
+            f"Download failed for {url}, will retry "
+            f"(attempt {retries + 1}/{max_retries}): {err}"
+        )
+        logger.warning(retry_msg)
+        print(retry_msg)  # Also print for daemon output
+        return DownloadStatus.PENDING
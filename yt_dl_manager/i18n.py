@@ -2,13 +2,17 @@
 
 This module provides translation support using Python's gettext module.
 Supports automatic locale detection and manual language override.
+The translation catalog is loaded lazily on the first call to ``_()``.
 """
 
+import functools
 import gettext
 import locale
 import os
 from pathlib import Path
-from typing import Optional, List
+from typing import FrozenSet, Optional, Tuple
+
+_LOCALE_DIR = Path(__file__).parent / 'locale'
 
 
 class TranslationManager:
@@ -27,7 +31,7 @@ class TranslationManager:
         """
         if language is None:
             language = detect_system_locale()
-        elif language not in get_available_languages():
+        elif not is_available_language(language):
             language = 'en'
 
         self.current_language = language
@@ -69,22 +73,7 @@ class TranslationManager:
         Returns:
             Current language code from available languages.
         """
-        if self.current_language is not None:
-            return self.current_language
-
-        if self.current_translation is None:
-            return detect_system_locale()
-
-        # Check if we have an actual translation loaded by checking the domain
-        info = self.current_translation.info()
-        if info:
-            # We have translation info, check available languages to determine which one
-            available_langs = get_available_languages()
-            # Return first non-English language if we have translation info
-            for lang in available_langs:
-                if lang != 'en':
-                    return lang
-        return 'en'
+        return self.current_language or detect_system_locale()
 
 
 # Module-level translation manager instance
@@ -93,28 +82,42 @@ translation_manager = TranslationManager()
 
 def get_locale_dir() -> Path:
     """Get the path to the locale directory."""
-    return Path(__file__).parent / 'locale'
+    return _LOCALE_DIR
+
 
+@functools.lru_cache(maxsize=1)
+def _scan_available_languages() -> Tuple[Tuple[str, ...], FrozenSet[str]]:
+    """Scan the locale directory once and cache the result.
 
-def get_available_languages() -> List[str]:
-    """Get list of available language codes by scanning locale directory."""
+    Returns:
+        Tuple of the sorted language codes and the same codes as a frozenset.
+    """
     locale_dir = get_locale_dir()
     # English is always available (default/source language)
     available_langs = ['en']
 
-    if not locale_dir.exists():
-        return available_langs
+    if locale_dir.exists():
+        # Scan for language directories with translation files
+        for lang_dir in locale_dir.iterdir():
+            if lang_dir.is_dir() and lang_dir.name != 'en':
+                mo_file = lang_dir / 'LC_MESSAGES' / 'yt-dl-manager.mo'
+                po_file = lang_dir / 'LC_MESSAGES' / 'yt-dl-manager.po'
+                # Check if either .mo or .po file exists
+                if mo_file.exists() or po_file.exists():
+                    available_langs.append(lang_dir.name)
+
+    available_langs = tuple(sorted(available_langs))
+    return available_langs, frozenset(available_langs)
+
 
-    # Scan for language directories with translation files
-    for lang_dir in locale_dir.iterdir():
-        if lang_dir.is_dir() and lang_dir.name != 'en':
-            mo_file = lang_dir / 'LC_MESSAGES' / 'yt-dl-manager.mo'
-            po_file = lang_dir / 'LC_MESSAGES' / 'yt-dl-manager.po'
-            # Check if either .mo or .po file exists
-            if mo_file.exists() or po_file.exists():
-                available_langs.append(lang_dir.name)
+def get_available_languages() -> Tuple[str, ...]:
+    """Get available language codes found in the locale directory."""
+    return _scan_available_languages()[0]
 
-    return sorted(available_langs)
+
+def is_available_language(language: str) -> bool:
+    """Check whether a translation exists for the given language code."""
+    return language in _scan_available_languages()[1]
 
 
 def detect_system_locale() -> str:
@@ -132,8 +135,8 @@ def detect_system_locale() -> str:
 
         if system_locale:
             # Extract language code (first 2 characters)
-            lang_code = system_locale.lower()[:2]
-            if lang_code in get_available_languages():
+            lang_code = system_locale[:2].lower()
+            if is_available_language(lang_code):
                 return lang_code
     except (locale.Error, AttributeError, TypeError):
         pass
@@ -151,6 +154,19 @@ def setup_translation(language: Optional[str] = None) -> None:
     translation_manager.setup(language)
 
 
+def preload_translations(language: Optional[str] = None) -> None:
+    """Load the translation catalog now instead of on the first lookup.
+
+    Useful before forking worker processes so the parsed catalog is shared.
+    Does nothing if a translation has already been loaded.
+
+    Args:
+        language: Language code from available languages, or None for auto-detection.
+    """
+    if translation_manager.current_translation is None:
+        translation_manager.setup(language)
+
+
 def _(message: str) -> str:
     """Translate a message using the current translation.
 
@@ -1,5 +1,6 @@
 """Logging configuration for yt-dl-manager."""
 
+import functools
 import logging
 import sys
 from pathlib import Path
@@ -7,19 +8,24 @@ from platformdirs import user_log_dir
 
 APP_NAME = "yt-dl-manager"
 
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_log_dir():
+    """Resolve the platform log directory once per process."""
+    return Path(user_log_dir(APP_NAME, APP_NAME))
+
 
 def setup_logging(level=logging.INFO):
     """Set up logging configuration for the application."""
-    # Create logs directory
-    log_dir = Path(user_log_dir(APP_NAME, APP_NAME))
+    log_dir = _get_log_dir()
+    # Recreate the directory if it was removed since the last setup
     log_dir.mkdir(parents=True, exist_ok=True)
     log_file = log_dir / "yt-dl-manager.log"
 
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
-
     # Set up root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
@@ -29,14 +35,14 @@ def setup_logging(level=logging.INFO):
         root_logger.removeHandler(handler)
 
     # File handler
-    file_handler = logging.FileHandler(log_file)
+    file_handler = logging.FileHandler(log_file, delay=True)
     file_handler.setLevel(level)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
     root_logger.addHandler(file_handler)
 
     # Console handler for warnings and errors
     console_handler = logging.StreamHandler(sys.stderr)
     console_handler.setLevel(logging.WARNING)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     root_logger.addHandler(console_handler)
     return log_file
@@ -4,6 +4,47 @@ import os
 from .db_utils import DatabaseUtils, DownloadStatus, sanitize_filename
 
 
+def _truncate(text, max_length=40):
+    """Truncate text for table display, marking cut text with '...'."""
+    return text if len(text) <= max_length else text[:max_length - 3] + '...'
+
+
+def _list_directory(directory):
+    """Map entry names in a directory to whether each is a symlink.
+
+    Returns an empty dict if the directory is unreadable.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_symlink() for entry in entries}
+    except OSError:
+        return {}
+
+
+def _find_missing_files(downloads):
+    """Return downloads whose final file no longer exists on disk.
+
+    Each parent directory is listed once with os.scandir instead of
+    stat-ing every file individually. Symlinks are still checked with
+    os.path.exists, so a broken link counts as missing just like in the
+    EXISTS column of the downloaded table.
+    """
+    existing = {}
+    missing_files = []
+    for download in downloads:
+        filename = download['final_filename']
+        if not filename:
+            continue
+        directory, basename = os.path.split(filename)
+        if directory not in existing:
+            existing[directory] = _list_directory(directory or os.curdir)
+        entries = existing[directory]
+        if basename not in entries or (entries[basename]
+                                       and not os.path.exists(filename)):
+            missing_files.append(download)
+    return missing_files
+
+
 class MaintenanceCommands:
     """Handles database maintenance operations for yt-dl-manager."""
 
@@ -43,50 +84,53 @@ class MaintenanceCommands:
             **filters
         )
 
-    def _format_display_text(self, text, max_length):
-        """Format text for table display with truncation."""
-        return text[:max_length-3] + '...' if len(text) > max_length else text
-
-    def _print_pending_downloads(self, downloads):
-        """Print pending downloads table."""
-        print(f"{'ID':<8} {'RETRIES':<8} {'REQUESTED':<20} {'URL':<40}")
-        print("-" * 80)
+    def _format_pending_downloads(self, downloads):
+        """Format pending downloads table lines."""
+        lines = [f"{'ID':<8} {'RETRIES':<8} {'REQUESTED':<20} {'URL':<40}",
+                 "-" * 80]
         for download in downloads:
-            url_display = self._format_display_text(download['url'], 40)
+            download_id = download['id']
+            retries = download['retries']
+            url_display = _truncate(download['url'], 40)
             timestamp = download['timestamp_requested']
             requested = timestamp[:16] if timestamp else 'N/A'
-            print(f"{download['id']:<8} {download['retries']:<8} "
-                  f"{requested:<20} {url_display:<40}")
-
-    def _print_failed_downloads(self, downloads):
-        """Print failed downloads table."""
-        print(f"{'ID':<8} {'RETRIES':<8} {'EXTRACTOR':<12} {'URL':<40}")
-        print("-" * 80)
+            lines.append(f"{download_id:<8} {retries:<8} "
+                         f"{requested:<20} {url_display:<40}")
+        return lines
+
+    def _format_failed_downloads(self, downloads):
+        """Format failed downloads table lines."""
+        lines = [f"{'ID':<8} {'RETRIES':<8} {'EXTRACTOR':<12} {'URL':<40}",
+                 "-" * 80]
         for download in downloads:
-            url_display = self._format_display_text(download['url'], 40)
-            extractor = download['extractor'] or 'N/A'
-            extractor_display = self._format_display_text(extractor, 12)
-            print(f"{download['id']:<8} {download['retries']:<8} "
-                  f"{extractor_display:<12} {url_display:<40}")
-
-    def _print_downloaded_files(self, downloads):
-        """Print downloaded files table."""
-        print(f"{'ID':<8} {'EXTRACTOR':<12} {'EXISTS':<7} {'FILENAME':<40}")
-        print("-" * 80)
+            download_id = download['id']
+            retries = download['retries']
+            url_display = _truncate(download['url'], 40)
+            extractor_display = _truncate(download['extractor'] or 'N/A', 12)
+            lines.append(f"{download_id:<8} {retries:<8} "
+                         f"{extractor_display:<12} {url_display:<40}")
+        return lines
+
+    def _format_downloaded_files(self, downloads):
+        """Format downloaded files table lines."""
+        lines = [f"{'ID':<8} {'EXTRACTOR':<12} {'EXISTS':<7} {'FILENAME':<40}",
+                 "-" * 80]
         for download in downloads:
-            filename = download['final_filename'] or 'N/A'
-            basename = sanitize_filename(filename)
-            filename_display = self._format_display_text(basename, 40)
-            file_exists = ('YES' if download['final_filename'] and
-                           os.path.exists(download['final_filename']) else 'NO')
-            extractor = download['extractor'] or 'N/A'
-            extractor_display = self._format_display_text(extractor, 12)
-            print(f"{download['id']:<8} {extractor_display:<12} "
-                  f"{file_exists:<7} {filename_display:<40}")
+            download_id = download['id']
+            filename = download['final_filename']
+            filename_display = _truncate(
+                sanitize_filename(filename or 'N/A'), 40)
+            file_exists = 'YES' if filename and os.path.exists(filename) else 'NO'
+            extractor_display = _truncate(download['extractor'] or 'N/A', 12)
+            lines.append(f"{download_id:<8} {extractor_display:<12} "
+                         f"{file_exists:<7} {filename_display:<40}")
+        return lines
 
     def print_downloads_table(self, downloads, status):
         """Print downloads in a formatted table.
 
+        The whole table is written with a single print call.
+
         Args:
             downloads (list): List of download records.
             status (str): Status being displayed.
@@ -95,17 +139,18 @@ class MaintenanceCommands:
             print(f"No {status} downloads found.")
             return
 
-        print(f"\n{status.upper()} DOWNLOADS ({len(downloads)} items):")
-        print("-" * 80)
+        lines = [f"\n{status.upper()} DOWNLOADS ({len(downloads)} items):",
+                 "-" * 80]
 
         if status == 'pending':
-            self._print_pending_downloads(downloads)
+            lines.extend(self._format_pending_downloads(downloads))
         elif status == 'failed':
-            self._print_failed_downloads(downloads)
+            lines.extend(self._format_failed_downloads(downloads))
         elif status == 'downloaded':
-            self._print_downloaded_files(downloads)
+            lines.extend(self._format_downloaded_files(downloads))
 
-        print("-" * 80)
+        lines.append("-" * 80)
+        print("\n".join(lines))
 
     def show_status(self):
         """Display queue status dashboard."""
@@ -238,9 +283,9 @@ class MaintenanceCommands:
         Returns:
             dict: Verification statistics.
         """
-        missing_files = self.db.get_downloads_missing_files()
         downloaded = self.db.get_downloads_by_status(
             DownloadStatus.DOWNLOADED.value)
+        missing_files = _find_missing_files(downloaded)
 
         stats = {
             'total_downloaded': len(downloaded),
@@ -306,17 +351,16 @@ class MaintenanceCommands:
             output_file (str, optional): Output file path.
 
         Returns:
-            str: Exported data.
+            str: Exported data, or None when streamed to output_file.
         """
-        data = self.db.export_data(output_format, status_filter)
-
         if output_file:
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(data)
+            with open(output_file, 'w', encoding='utf-8', newline='') as f:
+                self.db.export_data_to_file(f, output_format, status_filter)
             print(f"Data exported to {output_file}")
-        else:
-            print(data)
+            return None
 
+        data = self.db.export_data(output_format, status_filter)
+        print(data)
         return data
 
     def find_downloads_by_url(self, url_pattern):
@@ -4,6 +4,14 @@ import logging
 from .db_utils import DatabaseUtils
 from .config import config
 
+logger = logging.getLogger(__name__)
+
+
+def _validate_download_id(download_id):
+    """Raise ValueError unless download_id is a positive integer."""
+    if not isinstance(download_id, int) or download_id <= 0:
+        raise ValueError("download_id must be a positive integer")
+
 
 class Queue:
     """Centralized queue management class for yt-dl-manager.
@@ -19,23 +27,28 @@ class Queue:
         """
         return self.db.claim_pending_for_download(download_id)
 
-    def __init__(self, db_path=None):
+    def __init__(self, db_path=None, readonly=False):
         """Initialize the Queue with database path.
 
         Args:
             db_path (str, optional): Path to the SQLite database.
                                    If None, uses DATABASE_PATH from config.
+            readonly (bool): Open a read-only connection for callers that
+                             only query the queue.
         """
-        self.logger = logging.getLogger(__name__)
-
         if db_path is None:
             self.db_path = config['DEFAULT']['database_path']
         else:
             self.db_path = db_path
         self.db = DatabaseUtils(
-            self.db_path
+            self.db_path,
+            readonly=readonly
         )
 
+    def close(self):
+        """Close the queue's database connection."""
+        self.db.close()
+
     def add_url(self, media_url):
         """Add a media URL to the downloads queue.
 
@@ -52,19 +65,45 @@ class Queue:
         if not isinstance(media_url, str) or not media_url.strip():
             raise ValueError("media_url must be a non-empty string")
 
-        self.logger.info("Adding URL to queue: %s", media_url)
+        logger.info("Adding URL to queue: %s", media_url)
         try:
             success, message, row_id = self.db.add_url(media_url)
             if success:
-                self.logger.info(
+                logger.info(
                     "Successfully added URL to queue: %s", media_url)
             else:
-                self.logger.warning(
+                logger.warning(
                     "URL already exists in queue: %s", media_url)
             return success, message, row_id
         except Exception as e:
-            self.logger.error(
-                "Failed to add URL to queue: %s - %s", media_url, str(e))
+            logger.error(
+                "Failed to add URL to queue: %s - %s", media_url, e)
+            raise
+
+    def add_urls(self, media_urls):
+        """Add several media URLs to the downloads queue with a single commit.
+
+        Args:
+            media_urls (iterable): The URLs to add to the queue.
+
+        Returns:
+            int: Number of URLs newly added. Invalid and duplicate URLs
+            are skipped.
+
+        Raises:
+            ValueError: If any entry is not a non-empty string.
+        """
+        media_urls = list(media_urls)
+        if not all(isinstance(url, str) and url.strip() for url in media_urls):
+            raise ValueError("media_urls must contain non-empty strings")
+
+        logger.info("Adding %d URLs to queue", len(media_urls))
+        try:
+            added = self.db.add_urls_bulk(media_urls)
+            logger.info("Added %d of %d URLs to queue", added, len(media_urls))
+            return added
+        except Exception as e:
+            logger.error("Failed to add URLs to queue: %s", e)
             raise
 
     def get_pending(self):
@@ -76,42 +115,46 @@ class Queue:
         Raises:
             Exception: If database operation fails.
         """
-        self.logger.debug("Retrieving pending downloads")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Retrieving pending downloads")
         try:
             pending = self.db.poll_pending()
-            self.logger.debug("Found %d pending downloads", len(pending))
+            if debug:
+                logger.debug("Found %d pending downloads", len(pending))
             return pending
         except Exception as e:
-            self.logger.error(
-                "Failed to retrieve pending downloads: %s", str(e))
+            logger.error(
+                "Failed to retrieve pending downloads: %s", e)
             raise
 
     def get_in_progress(self):
         """Get all downloads currently in progress (status = 'downloading').
 
         Returns:
-            list: List of dicts for in-progress downloads.
+            list: List of sqlite3.Row records for in-progress downloads.
 
         Raises:
             Exception: If database operation fails.
         """
-        self.logger.debug("Retrieving in-progress downloads")
+        logger.debug("Retrieving in-progress downloads")
         try:
             in_progress = self.db.get_downloads_by_status(
                 'downloading',
                 sort_by='timestamp_requested',
                 order='DESC'
             )
-            self.logger.debug(
-                "Found %d in-progress downloads", len(in_progress))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Found %d in-progress downloads", len(in_progress))
             return in_progress
         except Exception as e:
-            self.logger.error(
-                "Failed to retrieve in-progress downloads: %s", str(e))
+            logger.error(
+                "Failed to retrieve in-progress downloads: %s", e)
             raise
 
     def get_downloads_by_status(self, status, limit=None, sort_by='timestamp_requested',
-                                order='DESC', **filters):
+                                order='DESC', **options):
         """Get downloads filtered by status.
 
         Args:
@@ -119,25 +162,28 @@ class Queue:
             limit (int, optional): Maximum number of results.
             sort_by (str): Field to sort by.
             order (str): Sort order (ASC, DESC).
-            **filters: Additional filters (retry_count, extractor).
+            **options: Projection and paging (columns, offset, as_tuples)
+                plus additional filters (retry_count, extractor).
 
         Returns:
-            list: List of download records as dictionaries.
+            list: List of sqlite3.Row download records, or tuples.
 
         Raises:
+            ValueError: If columns contains an unknown column name.
             Exception: If database operation fails.
         """
-        self.logger.debug("Getting downloads with status: %s", status)
+        logger.debug("Getting downloads with status: %s", status)
         try:
             downloads = self.db.get_downloads_by_status(
-                status, limit=limit, sort_by=sort_by, order=order, **filters
+                status, limit=limit, sort_by=sort_by, order=order, **options
             )
-            self.logger.debug(
-                "Found %d downloads with status %s", len(downloads), status)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Found %d downloads with status %s", len(downloads), status)
             return downloads
         except Exception as e:
-            self.logger.error(
-                "Failed to get downloads by status %s: %s", status, str(e))
+            logger.error(
+                "Failed to get downloads by status %s: %s", status, e)
             raise
 
     def start_download(self, download_id):
@@ -150,17 +196,15 @@ class Queue:
             ValueError: If download_id is not a positive integer.
             Exception: If database operation fails.
         """
-        if not isinstance(download_id, int) or download_id <= 0:
-            raise ValueError("download_id must be a positive integer")
-
-        self.logger.info("Starting download with ID: %d", download_id)
+        _validate_download_id(download_id)
+        logger.info("Starting download with ID: %d", download_id)
         try:
             self.db.mark_downloading(download_id)
-            self.logger.info(
+            logger.info(
                 "Successfully marked download %d as downloading", download_id)
         except Exception as e:
-            self.logger.error(
-                "Failed to start download %d: %s", download_id, str(e))
+            logger.error(
+                "Failed to start download %d: %s", download_id, e)
             raise
 
     def complete_download(self, download_id, filename, extractor):
@@ -175,21 +219,19 @@ class Queue:
             ValueError: If parameters are invalid.
             Exception: If database operation fails.
         """
-        if not isinstance(download_id, int) or download_id <= 0:
-            raise ValueError("download_id must be a positive integer")
+        _validate_download_id(download_id)
         if not isinstance(filename, str) or not filename.strip():
             raise ValueError("filename must be a non-empty string")
         if not isinstance(extractor, str) or not extractor.strip():
             raise ValueError("extractor must be a non-empty string")
-
-        self.logger.info(
+        logger.info(
             "Completing download %d with filename: %s", download_id, filename)
         try:
             self.db.mark_downloaded(download_id, filename, extractor)
-            self.logger.info("Successfully completed download %d", download_id)
+            logger.info("Successfully completed download %d", download_id)
         except Exception as e:
-            self.logger.error(
-                "Failed to complete download %d: %s", download_id, str(e))
+            logger.error(
+                "Failed to complete download %d: %s", download_id, e)
             raise
 
     def fail_download(self, download_id):
@@ -202,17 +244,15 @@ class Queue:
             ValueError: If download_id is not a positive integer.
             Exception: If database operation fails.
         """
-        if not isinstance(download_id, int) or download_id <= 0:
-            raise ValueError("download_id must be a positive integer")
-
-        self.logger.warning("Marking download %d as failed", download_id)
+        _validate_download_id(download_id)
+        logger.warning("Marking download %d as failed", download_id)
         try:
             self.db.mark_failed(download_id)
-            self.logger.info(
+            logger.info(
                 "Successfully marked download %d as failed", download_id)
         except Exception as e:
-            self.logger.error(
-                "Failed to mark download %d as failed: %s", download_id, str(e))
+            logger.error(
+                "Failed to mark download %d as failed: %s", download_id, e)
             raise
 
     def increment_retries(self, download_id):
@@ -225,17 +265,15 @@ class Queue:
             ValueError: If download_id is not a positive integer.
             Exception: If database operation fails.
         """
-        if not isinstance(download_id, int) or download_id <= 0:
-            raise ValueError("download_id must be a positive integer")
-
-        self.logger.debug("Incrementing retries for download %d", download_id)
+        _validate_download_id(download_id)
+        logger.debug("Incrementing retries for download %d", download_id)
         try:
             self.db.increment_retries(download_id)
-            self.logger.debug(
+            logger.debug(
                 "Successfully incremented retries for download %d", download_id)
         except Exception as e:
-            self.logger.error("Failed to increment retries for download %d: %s",
-                              download_id, str(e))
+            logger.error("Failed to increment retries for download %d: %s",
+                         download_id, e)
             raise
 
     def set_status_to_pending(self, download_id):
@@ -248,17 +286,36 @@ class Queue:
             ValueError: If download_id is not a positive integer.
             Exception: If database operation fails.
         """
-        if not isinstance(download_id, int) or download_id <= 0:
-            raise ValueError("download_id must be a positive integer")
-
-        self.logger.debug("Setting download %d status to pending", download_id)
+        _validate_download_id(download_id)
+        logger.debug("Setting download %d status to pending", download_id)
         try:
             self.db.set_status_to_pending(download_id)
-            self.logger.debug(
+            logger.debug(
                 "Successfully set download %d to pending", download_id)
         except Exception as e:
-            self.logger.error(
-                "Failed to set download %d to pending: %s", download_id, str(e))
+            logger.error(
+                "Failed to set download %d to pending: %s", download_id, e)
+            raise
+
+    def retry_download(self, download_id):
+        """Increment retries and requeue a download in a single write.
+
+        Args:
+            download_id (int): The database row ID of the download.
+
+        Raises:
+            ValueError: If download_id is not a positive integer.
+            Exception: If database operation fails.
+        """
+        _validate_download_id(download_id)
+        logger.debug("Requeueing download %d for retry", download_id)
+        try:
+            self.db.retry_download_atomic(download_id)
+            logger.debug(
+                "Successfully requeued download %d for retry", download_id)
+        except Exception as e:
+            logger.error(
+                "Failed to requeue download %d for retry: %s", download_id, e)
             raise
 
     def get_queue_length(self):
@@ -270,13 +327,38 @@ class Queue:
         Raises:
             Exception: If database operation fails.
         """
-        self.logger.debug("Getting queue length")
+        logger.debug("Getting queue length")
         try:
             length = self.db.queue_length()
-            self.logger.debug("Queue length: %d", length)
+            logger.debug("Queue length: %d", length)
             return length
         except Exception as e:
-            self.logger.error("Failed to get queue length: %s", str(e))
+            logger.error("Failed to get queue length: %s", e)
+            raise
+
+    def get_dashboard_snapshot(self, recent_limit, pending_limit=None,
+                               recent_offset=0, known=None):
+        """Read fingerprints and changed listings for the TUI in one call.
+
+        Args:
+            recent_limit (int): Maximum number of downloaded rows.
+            pending_limit (int, optional): Maximum number of pending rows.
+            recent_offset (int): Number of downloaded rows to skip.
+            known (dict, optional): Fingerprints already displayed, by status.
+
+        Returns:
+            dict: Fingerprints by status plus row tuples for each changed
+            status.
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        try:
+            return self.db.get_dashboard_snapshot(
+                recent_limit, pending_limit=pending_limit,
+                recent_offset=recent_offset, known=known)
+        except Exception as e:
+            logger.error("Failed to read dashboard snapshot: %s", e)
             raise
 
     def get_queue_status(self):
@@ -288,9 +370,9 @@ class Queue:
         Raises:
             Exception: If database operation fails.
         """
-        self.logger.debug("Getting queue status statistics")
+        logger.debug("Getting queue status statistics")
         try:
             return self.db.get_queue_status()
         except Exception as e:
-            self.logger.error("Failed to get queue status: %s", str(e))
+            logger.error("Failed to get queue status: %s", e)
             raise
@@ -2,19 +2,108 @@
 
 import logging
 import asyncio
+import importlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache, partial
 from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import DataTable, Header, Footer, Input, Label, Button
 from textual.screen import ModalScreen
-from textual.message import Message
 from textual.binding import Binding
 # from textual.widgets._data_table import RowKey
 
 from .queue import Queue
+from .db_utils import DownloadStatus
 from .download_utils import download_media
 from .i18n import _ as gettext
 
+# Maximum number of pending downloads shown in the pending table
+PENDING_DISPLAY_LIMIT = 200
+# Trailing delay used to coalesce bursts of refresh requests
+REFRESH_DEBOUNCE_SECONDS = 0.2
+# Auto-refresh delays while downloads run, while items wait, and when idle
+REFRESH_INTERVAL_ACTIVE = 0.5
+REFRESH_INTERVAL_PENDING = 2.0
+REFRESH_INTERVAL_IDLE = 10.0
+# How long a status message stays visible
+STATUS_CLEAR_SECONDS = 3.0
+# Above this recent_limit the completed table renders a sliding window of
+# rows, shifted by a step when scrolled to an edge
+COMPLETED_WINDOW_THRESHOLD = 100
+COMPLETED_WINDOW_SIZE = 50
+COMPLETED_WINDOW_STEP = 25
+# Download status shown by each table
+TABLE_STATUSES = {
+    'pending': 'pending',
+    'inprogress': 'downloading',
+    'completed': 'downloaded',
+}
+
+
+@lru_cache(maxsize=8192)
+def _truncate(text, max_length):
+    """Cut text to max_length characters, appending '...' when shortened.
+
+    Cached because the same URLs and filenames are rendered every refresh.
+    """
+    return text if len(text) <= max_length else f"{text[:max_length]}..."
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(timestamp):
+    """Format a stored ISO timestamp as 'YYYY-MM-DD HH:MM' for display.
+
+    Stored timestamps share one ISO layout, so the display form is sliced
+    straight out of the string; only other 'T'-separated values go through
+    datetime parsing. Results are cached since each row's timestamp is
+    formatted on every refresh.
+    """
+    if not timestamp:
+        return ''
+    if isinstance(timestamp, str):
+        if len(timestamp) >= 16 and timestamp[10] in 'T ' \
+                and timestamp[4] == '-' and timestamp[13] == ':':
+            return f"{timestamp[:10]} {timestamp[11:16]}"
+        if 'T' in timestamp:
+            try:
+                return datetime.fromisoformat(
+                    timestamp.replace('Z', '+00:00')).strftime('%Y-%m-%d %H:%M')
+            except ValueError:
+                pass
+    return str(timestamp)[:16]
+
+
+def _translate_texts():
+    """Translate the TUI's fixed strings and message templates.
+
+    Called once per app rather than at import, so the language chosen on
+    the command line (the catalog loads lazily) is the one used.
+    """
+    return {
+        'pending_columns': (gettext("ID"), gettext("URL"), gettext("Status"),
+                            gettext("Requested"), gettext("Retries")),
+        'inprogress_columns': (gettext("ID"), gettext("URL"), gettext("Status"),
+                               gettext("Started"), gettext("Retries")),
+        'completed_columns': (gettext("ID"), gettext("URL"),
+                              gettext("Downloaded"), gettext("File")),
+        'not_found': gettext("✗ Download {} not found in pending queue"),
+        'starting': gettext("🚀 Starting download for ID {}..."),
+        'error': gettext("✗ Error: %s"),
+        'no_selection': gettext("⚠ No item selected"),
+        'completed': gettext("✓ Download completed for ID {}"),
+        'failed': gettext("✗ Download failed for ID {}: {}"),
+        'download_error': gettext("✗ Download error for ID %s: %s"),
+        'refreshed': gettext("🔄 Data refreshed"),
+    }
+
+
+def _update_changed_cells(table, row_key, column_keys, old_row, new_row):
+    """Update only the cells of a table row whose value changed."""
+    for column_key, old_value, value in zip(column_keys, old_row, new_row):
+        if old_value != value:
+            table.update_cell(row_key, column_key, value)
+
 
 class URLInputModal(ModalScreen):
     """Modal screen for entering new URLs."""
@@ -64,19 +153,14 @@ class URLInputModal(ModalScreen):
         try:
             success, message, _ = self.app_ref.queue.add_url(url)
             if success:
-                self.app_ref.post_message(
-                    TUIApp.StatusUpdate(gettext("✓ Added: {}").format(url))
-                )
+                await self.app_ref.show_status(
+                    gettext("✓ Added: {}").format(url))
             else:
-                self.app_ref.post_message(
-                    TUIApp.StatusUpdate(gettext("⚠ {}").format(message))
-                )
+                await self.app_ref.show_status(gettext("⚠ {}").format(message))
             # Refresh the data after adding URL
-            self.app_ref.post_message(TUIApp.RefreshData())
+            self.app_ref.schedule_refresh()
         except (ValueError, RuntimeError) as e:
-            self.app_ref.post_message(
-                TUIApp.StatusUpdate(gettext("✗ Error: %s") % str(e))
-            )
+            await self.app_ref.show_status(gettext("✗ Error: %s") % str(e))
 
 
 class TUIApp(App):
@@ -140,16 +224,6 @@ class TUIApp(App):
         Binding("q", "quit", "Quit", show=True, priority=True),
     ]
 
-    class StatusUpdate(Message):
-        """Message to update status display."""
-
-        def __init__(self, message: str):
-            self.message = message
-            super().__init__()
-
-    class RefreshData(Message):
-        """Message to refresh data tables."""
-
     def __init__(self, recent_limit: int = 10):
         """Initialize the TUI app.
 
@@ -159,13 +233,44 @@ class TUIApp(App):
         super().__init__()
         self.recent_limit = recent_limit
         self.queue = Queue()
+        # Refreshes read through a separate read-only connection so they
+        # never wait on the writer; self.queue is used for writes
+        self.read_queue = Queue(readonly=True)
         self.logger = logging.getLogger(__name__)
 
         # UI state management
         self.ui_state = {
             'status_message': "",
             'selected_pending_id': None,
-            'last_status_task': None
+            # (id, url, retries) of each displayed pending download by ID
+            'pending_index': {},
+            # Task clearing the status label and when it should clear it
+            'status_task': None,
+            'status_deadline': 0.0,
+            'refresh_task': None,
+            'refresh_timer': None,
+            'dirty': False,
+            # Set while the app is suspended to the shell (e.g. Ctrl+Z)
+            'suspended': False,
+            # Column keys per table, the RowKey of each displayed download
+            # ID and the row tuple last rendered for it
+            'column_keys': {},
+            'row_keys': {'pending': {}, 'inprogress': {}, 'completed': {}},
+            'rendered_rows': {'pending': {}, 'inprogress': {}, 'completed': {}},
+            # Status fingerprint each table was last rendered from
+            'fingerprints': {},
+            # Widgets resolved once by selector, see _widget()
+            'widgets': {},
+            # Single reader thread for read_queue calls, see _read()
+            'db_pool': ThreadPoolExecutor(max_workers=1,
+                                          thread_name_prefix='db-read'),
+            # Worker threads for downloads, see _start_download_async()
+            'download_pool': ThreadPoolExecutor(max_workers=2,
+                                                thread_name_prefix='dl'),
+            # First row of the completed window
+            'completed_window': {'offset': 0},
+            # Translated headers and message templates, see _translate_texts()
+            'texts': _translate_texts()
         }
 
         # Set translated title and subtitle
@@ -196,70 +301,68 @@ class TUIApp(App):
     async def on_mount(self) -> None:
         """Initialize tables when app is mounted."""
         await self.setup_tables()
+        # setup_tables resolved the tables; resolve the status label too
+        self._widget("#status-label", Label)
         await self.refresh_data()
-        # Start periodic auto-refresh every 2 seconds
-        self.set_interval(2.0, self.refresh_data)
+        # Start the adaptive auto-refresh
+        self._schedule_auto_refresh()
+        self.app_suspend_signal.subscribe(self, self._on_app_suspend)
+        self.app_resume_signal.subscribe(self, self._on_app_resume)
+        if self.recent_limit > COMPLETED_WINDOW_THRESHOLD:
+            self.watch(self._widget("#completed-table", DataTable),
+                       "scroll_y", self._on_completed_scroll, init=False)
         # Focus the pending table so user can select items
-        pending_table = self.query_one("#pending-table", DataTable)
+        pending_table = self._widget("#pending-table", DataTable)
         pending_table.focus()
 
+    def _widget(self, selector, expect_type):
+        """Return a widget by selector, walking the DOM only the first time."""
+        widgets = self.ui_state['widgets']
+        widget = widgets.get(selector)
+        if widget is None:
+            widget = widgets[selector] = self.query_one(selector, expect_type)
+        return widget
+
     async def setup_tables(self) -> None:
         """Set up the data tables with columns."""
-        pending_table = self.query_one("#pending-table", DataTable)
-        pending_table.add_columns(
-            gettext("ID"), gettext("URL"), gettext("Status"),
-            gettext("Requested"), gettext("Retries"))
+        column_keys = self.ui_state['column_keys']
+        pending_table = self._widget("#pending-table", DataTable)
+        texts = self.ui_state['texts']
+        column_keys['pending'] = pending_table.add_columns(
+            *texts['pending_columns'])
 
         # Allow pending table to be focused for selection
         pending_table.can_focus = True
 
-        inprogress_table = self.query_one("#inprogress-table", DataTable)
-        inprogress_table.add_columns(
-            gettext("ID"), gettext("URL"), gettext("Status"),
-            gettext("Started"), gettext("Retries")
-        )
+        inprogress_table = self._widget("#inprogress-table", DataTable)
+        column_keys['inprogress'] = inprogress_table.add_columns(
+            *texts['inprogress_columns'])
         inprogress_table.can_focus = False
 
-        completed_table = self.query_one("#completed-table", DataTable)
-        completed_table.add_columns(
-            gettext("ID"), gettext("URL"), gettext("Downloaded"), gettext("File"))
+        completed_table = self._widget("#completed-table", DataTable)
+        column_keys['completed'] = completed_table.add_columns(
+            *texts['completed_columns'])
 
         # Make sure tables don't interfere with app-level key bindings
         completed_table.can_focus = False
 
-    async def on_key(self, event) -> None:
-        """Handle key press events."""
-        self.logger.debug("Key pressed: %s", event.key)
-
-        if event.key == "d":
-            self.logger.debug("D key detected, calling action_start_download")
-            await self.action_start_download()
-            event.prevent_default()
-        elif event.key == "a":
-            self.logger.debug("A key detected, calling action_add_url")
-            await self.action_add_url()
-            event.prevent_default()
-        elif event.key == "r":
-            self.logger.debug("R key detected, calling action_refresh")
-            await self.action_refresh()
-            event.prevent_default()
-        elif event.key == "q":
-            self.logger.debug("Q key detected, calling action_quit")
-            await self.action_quit()
-            event.prevent_default()
-
     async def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         """Handle row highlighting in pending downloads table."""
         if event.data_table.id == "pending-table":
-            self.logger.debug("Row highlighted: %s", event.row_key)
+            # Fires on every cursor move, so skip debug calls unless enabled
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("Row highlighted: %s", event.row_key)
             if event.row_key.value is not None:
                 try:
                     # Get the ID from the first column of the highlighted row
                     row_data = event.data_table.get_row(event.row_key)
                     if row_data:
                         self.ui_state['selected_pending_id'] = int(row_data[0])
-                        self.logger.debug(
-                            "Highlighted pending ID: %d", self.ui_state['selected_pending_id'])
+                        if debug:
+                            self.logger.debug(
+                                "Highlighted pending ID: %d",
+                                self.ui_state['selected_pending_id'])
                     else:
                         self.ui_state['selected_pending_id'] = None
                 except (ValueError, IndexError) as e:
@@ -269,78 +372,189 @@ class TUIApp(App):
     async def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in pending downloads table."""
         if event.data_table.id == "pending-table":
-            self.logger.debug("Row selected: %s", event.row_key)
+            debug = self.logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                self.logger.debug("Row selected: %s", event.row_key)
             try:
                 # Get the ID from the first column of the selected row
                 row_data = event.data_table.get_row(event.row_key)
                 if row_data:
                     self.ui_state['selected_pending_id'] = int(row_data[0])
-                    self.logger.debug(
-                        "Row selected, pending ID: %d", self.ui_state['selected_pending_id'])
+                    if debug:
+                        self.logger.debug(
+                            "Row selected, pending ID: %d",
+                            self.ui_state['selected_pending_id'])
                 else:
                     self.ui_state['selected_pending_id'] = None
             except (ValueError, IndexError) as e:
                 self.logger.debug("Error getting selected row: %s", e)
                 self.ui_state['selected_pending_id'] = None
 
-    async def refresh_data(self) -> None:
-        """Refresh data in all tables."""
-        await self.refresh_pending_downloads()
-        await self.refresh_inprogress_downloads()
-        await self.refresh_completed_downloads()
+    def _auto_refresh_delay(self) -> float:
+        """Pick the next auto-refresh delay from what the tables show."""
+        row_keys = self.ui_state['row_keys']
+        if self.ui_state['dirty'] or row_keys['inprogress']:
+            return REFRESH_INTERVAL_ACTIVE
+        if row_keys['pending']:
+            return REFRESH_INTERVAL_PENDING
+        return REFRESH_INTERVAL_IDLE
+
+    def _schedule_auto_refresh(self) -> None:
+        """(Re)start the auto-refresh timer with the current delay."""
+        timer = self.ui_state['refresh_timer']
+        if timer is not None:
+            timer.stop()
+        self.ui_state['refresh_timer'] = self.set_timer(
+            self._auto_refresh_delay(), self._tick_auto_refresh)
+
+    async def _tick_auto_refresh(self) -> None:
+        """Refresh all tables, then schedule the next auto-refresh."""
+        try:
+            await self.refresh_data()
+        finally:
+            self._schedule_auto_refresh()
 
-    async def refresh_pending_downloads(self) -> None:
-        """Refresh the pending downloads table."""
-        pending_table = self.query_one("#pending-table", DataTable)
+    def mark_dirty(self) -> None:
+        """Flag a local change and bring the next auto-refresh forward."""
+        self.ui_state['dirty'] = True
+        self._schedule_auto_refresh()
 
-        # Store current selection ID
-        current_selection = self.ui_state['selected_pending_id']
+    def refresh_paused(self) -> bool:
+        """Whether nobody can see the tables, so refreshing is wasted work.
 
-        pending_table.clear()
+        True while the app is suspended or a modal screen covers the
+        tables. An unfocused terminal keeps refreshing, since the dashboard
+        is often watched from a split or a neighbouring window.
+        """
+        return self.ui_state['suspended'] or len(self.screen_stack) > 1
+
+    def _on_app_suspend(self, _app) -> None:
+        """Stop refreshing while the app is suspended."""
+        self.ui_state['suspended'] = True
+
+    def _on_app_resume(self, _app) -> None:
+        """Catch up soon after the app is resumed."""
+        self.ui_state['suspended'] = False
+        self.mark_dirty()
+
+    async def refresh_data(self) -> None:
+        """Refresh data in all tables from a single dashboard snapshot.
 
+        One read returns the fingerprint of every table's status and rows
+        only for the statuses that changed; unchanged tables are skipped.
+        Nothing is read while refresh_paused() is true.
+        """
+        if self.refresh_paused():
+            return
+        self.ui_state['dirty'] = False
+        fingerprints = self.ui_state['fingerprints']
+        limit, offset = self._completed_page()
         try:
-            # Get pending downloads with full information
-            pending_downloads = self.queue.get_downloads_by_status(
-                'pending',
-                sort_by='timestamp_requested',
-                order='DESC'
+            snapshot = await self._read(
+                self.read_queue.get_dashboard_snapshot,
+                limit,
+                pending_limit=PENDING_DISPLAY_LIMIT,
+                recent_offset=offset,
+                known={status: fingerprints.get(name)
+                       for name, status in TABLE_STATUSES.items()}
             )
+            # Repaint once after all tables are updated
+            with self.batch_update():
+                if 'pending' in snapshot:
+                    self._apply_pending(snapshot['pending'])
+                if 'downloading' in snapshot:
+                    self._apply_inprogress(snapshot['downloading'])
+                if 'downloaded' in snapshot:
+                    self._apply_completed(snapshot['downloaded'])
+            for name, status in TABLE_STATUSES.items():
+                fingerprints[name] = snapshot['fingerprints'][status]
+        except (ValueError, RuntimeError) as e:
+            self.logger.error("Error refreshing dashboard: %s", e)
 
-            restore_row = None
-            for download in pending_downloads:
-                # Format timestamp
-                requested = download.get('timestamp_requested', '')
-                if requested:
-                    try:
-                        dt = datetime.fromisoformat(
-                            requested.replace('Z', '+00:00'))
-                        requested = dt.strftime('%Y-%m-%d %H:%M')
-                    except (ValueError, AttributeError):
-                        requested = str(requested)[:16]
-
-                # Truncate long URLs for display
-                url = download.get('url', '')
-                display_url = url[:50] + '...' if len(url) > 50 else url
-
-                row_key = pending_table.add_row(
-                    str(download.get('id', '')),
-                    display_url,
-                    download.get('status', ''),
-                    requested,
-                    str(download.get('retries', 0))
-                )
-
-                # Check if this was the previously selected row
-                if current_selection and download.get('id') == current_selection:
-                    restore_row = row_key
-
-            # Restore selection if possible, or select first row
-            if pending_downloads:
-                self._restore_or_select_first_row(
-                    pending_table, pending_downloads, restore_row)
+    async def _read(self, func, *args, **kwargs):
+        """Run a blocking database read on the reader thread.
 
-        except (ValueError, RuntimeError) as e:
-            self.logger.error("Error refreshing pending downloads: %s", e)
+        All reads share one worker, so they reuse read_queue's connection
+        in order instead of contending for it from several threads.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.ui_state['db_pool'], partial(func, *args, **kwargs))
+
+    def _apply_pending(self, pending_downloads):
+        """Render pending downloads and restore the row selection."""
+        pending_table = self._widget("#pending-table", DataTable)
+        current_selection = self.ui_state['selected_pending_id']
+        self.ui_state['pending_index'] = {
+            row_id: (row_id, url, retries)
+            for row_id, url, _, _, retries in pending_downloads}
+
+        # Rows are tuples of DASHBOARD_COLUMNS['pending']
+        rows = [
+            (str(row_id), _truncate(url, 50), status,
+             _format_timestamp(requested), str(retries))
+            for row_id, url, status, requested, retries in pending_downloads
+        ]
+        row_keys = self._sync_table(pending_table, 'pending', rows)
+
+        # Check if the previously selected row is still pending
+        restore_row = None
+        if current_selection:
+            restore_row = row_keys.get(str(current_selection))
+
+        # Restore selection if possible, or select first row
+        if pending_downloads:
+            self._restore_or_select_first_row(
+                pending_table, pending_downloads, restore_row)
+
+    def _sync_table(self, table, name, rows):
+        """Bring a table in line with rows by diffing on the ID column.
+
+        Rows whose ID disappeared are removed, new IDs are added, and cells
+        that differ from the last rendered row are updated in place. Rows
+        equal to their rendered tuple are skipped without touching the
+        table, which is only re-sorted when its display order differs. All
+        changes are made inside one batch update, so they cost one repaint.
+
+        Args:
+            table: The DataTable to update.
+            name: Key of the table in ui_state['row_keys'].
+            rows: Row tuples in display order; the first cell is the ID.
+
+        Returns:
+            dict: Mapping of displayed ID to the row's RowKey.
+        """
+        row_keys = self.ui_state['row_keys'][name]
+        rendered = self.ui_state['rendered_rows'][name]
+        column_keys = self.ui_state['column_keys'].get(name, ())
+        wanted = {row[0] for row in rows}
+
+        # Every change below is repainted once, when the batch ends
+        with self.batch_update():
+            for row_id in [row_id for row_id in row_keys if row_id not in wanted]:
+                table.remove_row(row_keys.pop(row_id))
+                rendered.pop(row_id, None)
+
+            new_rows = []
+            for row in rows:
+                row_id = row[0]
+                old_row = rendered.get(row_id)
+                if old_row is None:
+                    new_rows.append(row)
+                elif old_row != row:
+                    _update_changed_cells(
+                        table, row_keys[row_id], column_keys, old_row, row)
+                rendered[row_id] = row
+
+            if new_rows:
+                row_keys.update(zip((row[0] for row in new_rows),
+                                    table.add_rows(new_rows)))
+
+            order = [row_keys[row[0]] for row in rows]
+            if [row.key for row in table.ordered_rows] != order:
+                positions = {row[0]: index for index, row in enumerate(rows)}
+                table.sort(key=lambda cells: positions[cells[0]])
+        return row_keys
 
     def _restore_or_select_first_row(self, pending_table, pending_downloads, restore_row):
         """Restore previous selection or select first row."""
@@ -348,7 +562,9 @@ class TUIApp(App):
             try:
                 # Only try to move cursor if the restore_row is valid
                 if restore_row in pending_table.rows:
-                    pending_table.move_cursor(row=restore_row)
+                    row_index = pending_table.get_row_index(restore_row)
+                    if pending_table.cursor_row != row_index:
+                        pending_table.move_cursor(row=row_index)
                     # Update selected_pending_id to match the restored selection
                     row_data = pending_table.get_row(restore_row)
                     if row_data:
@@ -365,92 +581,71 @@ class TUIApp(App):
         try:
             # If we have rows and downloads, set the selected_pending_id to the first download's ID
             if pending_downloads and pending_table.row_count > 0:
-                self.ui_state['selected_pending_id'] = pending_downloads[0].get('id')
-                self.logger.debug(
-                    "Selected first pending ID: %s", self.ui_state['selected_pending_id'])
+                self.ui_state['selected_pending_id'] = pending_downloads[0][0]
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Selected first pending ID: %s",
+                        self.ui_state['selected_pending_id'])
                 # Let the table handle cursor positioning naturally
         except (IndexError, KeyError, ValueError) as e:
             self.logger.debug("Error selecting first row: %s", e)
 
-    async def refresh_inprogress_downloads(self) -> None:
-        """Refresh the in-progress downloads table."""
-        inprogress_table = self.query_one("#inprogress-table", DataTable)
-        inprogress_table.clear()
-
-        try:
-            inprogress_downloads = self.queue.get_in_progress()
-            for download in inprogress_downloads:
-                # Format timestamp
-                started = download.get('timestamp_requested', '')
-                if started:
-                    try:
-                        dt = datetime.fromisoformat(
-                            started.replace('Z', '+00:00'))
-                        started = dt.strftime('%Y-%m-%d %H:%M')
-                    except (ValueError, AttributeError):
-                        started = str(started)[:16]
-
-                # Truncate long URLs for display
-                url = download.get('url', '')
-                display_url = url[:50] + '...' if len(url) > 50 else url
-
-                inprogress_table.add_row(
-                    str(download.get('id', '')),
-                    display_url,
-                    download.get('status', ''),
-                    started,
-                    str(download.get('retries', 0))
-                )
-        except (ValueError, RuntimeError) as e:
-            self.logger.error(
-                "Error refreshing in-progress downloads: %s", e)
+    def _apply_inprogress(self, inprogress_downloads):
+        """Render in-progress downloads."""
+        inprogress_table = self._widget("#inprogress-table", DataTable)
+        # Rows are tuples of DASHBOARD_COLUMNS['downloading']
+        self._sync_table(inprogress_table, 'inprogress', [
+            (str(row_id), _truncate(url, 50), status,
+             _format_timestamp(requested), str(retries))
+            for row_id, url, status, requested, retries in inprogress_downloads
+        ])
+
+    def _apply_completed(self, downloads):
+        """Render completed downloads."""
+        completed_table = self._widget("#completed-table", DataTable)
+        # Rows are tuples of DASHBOARD_COLUMNS['downloaded']
+        self._sync_table(completed_table, 'completed', [
+            (str(row_id), _truncate(url, 40), _format_timestamp(downloaded),
+             _truncate(filename, 60) if filename else 'N/A')
+            for row_id, url, downloaded, filename in downloads
+        ])
+
+    def _completed_page(self):
+        """Return the (limit, offset) of the completed rows to display."""
+        if self.recent_limit <= COMPLETED_WINDOW_THRESHOLD:
+            return self.recent_limit, 0
+        offset = self.ui_state['completed_window']['offset']
+        return min(COMPLETED_WINDOW_SIZE, self.recent_limit - offset), offset
+
+    def _on_completed_scroll(self, scroll_y) -> None:
+        """Shift the completed window when its table hits a scroll edge."""
+        completed_table = self._widget("#completed-table", DataTable)
+        window = self.ui_state['completed_window']
+        offset = window['offset']
+        window_full = (len(self.ui_state['row_keys']['completed'])
+                       >= COMPLETED_WINDOW_SIZE)
+
+        if (scroll_y >= completed_table.max_scroll_y and window_full
+                and offset + COMPLETED_WINDOW_SIZE < self.recent_limit):
+            new_offset = min(offset + COMPLETED_WINDOW_STEP,
+                             self.recent_limit - COMPLETED_WINDOW_SIZE)
+        elif scroll_y <= 0 < offset:
+            new_offset = max(offset - COMPLETED_WINDOW_STEP, 0)
+        else:
+            return
 
-    async def refresh_completed_downloads(self) -> None:
-        """Refresh the completed downloads table."""
-        completed_table = self.query_one("#completed-table", DataTable)
-        completed_table.clear()
+        window['offset'] = new_offset
+        # Force the snapshot to list the completed rows again
+        self.ui_state['fingerprints'].pop('completed', None)
+        self.run_worker(self._shift_completed_window(new_offset - offset),
+                        exclusive=True, group="completed-window")
 
-        try:
-            # Get completed downloads using existing database methods
-            downloads = self.queue.get_downloads_by_status(
-                'downloaded',
-                limit=self.recent_limit,
-                sort_by='timestamp_downloaded',
-                order='DESC'
-            )
-
-            for download in downloads:
-                # Format timestamp
-                downloaded = download.get('timestamp_downloaded', '')
-                if downloaded:
-                    try:
-                        dt = datetime.fromisoformat(
-                            downloaded.replace('Z', '+00:00'))
-                        downloaded = dt.strftime('%Y-%m-%d %H:%M')
-                    except (ValueError, AttributeError):
-                        downloaded = str(downloaded)[:16]
-
-                # Truncate long URLs and filenames for display
-                url = download.get('url', '')
-                display_url = url[:40] + '...' if len(url) > 40 else url
-
-                filename = download.get('final_filename', '')
-                if filename:
-                    # Show the full path to the file
-                    display_filename = filename[:60] + \
-                        '...' if len(filename) > 60 else filename
-                else:
-                    display_filename = 'N/A'
-
-                completed_table.add_row(
-                    str(download.get('id', '')),
-                    display_url,
-                    downloaded,
-                    display_filename
-                )
-        except (ValueError, RuntimeError) as e:
-            self.logger.error(
-                "Error refreshing completed downloads: %s", e)
+    async def _shift_completed_window(self, delta) -> None:
+        """Render the shifted window and keep the visible rows in place."""
+        await self.refresh_data()
+        completed_table = self._widget("#completed-table", DataTable)
+        completed_table.scroll_to(
+            y=max(completed_table.scroll_y - delta, 0), animate=False)
 
     async def action_add_url(self) -> None:
         """Show modal to add new URL."""
@@ -459,12 +654,15 @@ class TUIApp(App):
 
     def _get_current_pending_selection(self):
         """Get the current selection from the pending table."""
-        pending_table = self.query_one("#pending-table", DataTable)
+        pending_table = self._widget("#pending-table", DataTable)
+        debug = self.logger.isEnabledFor(logging.DEBUG)
 
         # First try the explicitly tracked selection
         if self.ui_state['selected_pending_id'] is not None:
-            self.logger.debug(
-                "Using tracked selection: %s", self.ui_state['selected_pending_id'])
+            if debug:
+                self.logger.debug(
+                    "Using tracked selection: %s",
+                    self.ui_state['selected_pending_id'])
             return self.ui_state['selected_pending_id']
 
         # Then try to get from current cursor position
@@ -473,8 +671,9 @@ class TUIApp(App):
                 row_data = pending_table.get_row(pending_table.cursor_row)
                 if row_data and len(row_data) > 0:
                     selection_id = int(row_data[0])
-                    self.logger.debug(
-                        "Got selection from cursor: %s", selection_id)
+                    if debug:
+                        self.logger.debug(
+                            "Got selection from cursor: %s", selection_id)
                     return selection_id
             except (ValueError, IndexError) as e:
                 self.logger.debug("Error getting cursor row: %s", e)
@@ -482,12 +681,13 @@ class TUIApp(App):
         # Finally, try to get the first row if table is not empty
         if pending_table.row_count > 0:
             try:
-                first_row_key = list(pending_table.rows.keys())[0]
-                row_data = pending_table.get_row(first_row_key)
+                # Rows may be re-sorted, so read by display position
+                row_data = pending_table.get_row_at(0)
                 if row_data and len(row_data) > 0:
                     selection_id = int(row_data[0])
-                    self.logger.debug(
-                        "Got selection from first row: %s", selection_id)
+                    if debug:
+                        self.logger.debug(
+                            "Got selection from first row: %s", selection_id)
                     return selection_id
             except (ValueError, IndexError) as e:
                 self.logger.debug("Error getting first row: %s", e)
@@ -497,85 +697,113 @@ class TUIApp(App):
     async def action_start_download(self) -> None:
         """Start download for the selected pending item."""
         self.logger.debug("action_start_download called")
+        texts = self.ui_state['texts']
 
         selection_id = self._get_current_pending_selection()
 
         if selection_id is not None:
             try:
-                # Get the full download info from database
-                pending_downloads = self.queue.get_pending()
-                self.logger.debug("Pending downloads: %s", pending_downloads)
-                download_info = None
-                for row_id, url, retries in pending_downloads:
-                    if row_id == selection_id:
-                        download_info = (row_id, url, retries)
-                        break
+                # Look up the row the last pending refresh fetched; the
+                # download claims it atomically, so a stale entry is safe
+                download_info = self.ui_state['pending_index'].get(selection_id)
 
                 if download_info is None:
-                    await self.show_status(gettext("✗ Download {} not found in pending queue").format(selection_id))
+                    await self.show_status(texts['not_found'].format(selection_id))
                     return
 
                 row_id, url, retries = download_info
 
                 # Start the download in a background task
-                self.logger.debug(
-                    "Starting download for row_id=%s, url=%s, retries=%s", row_id, url, retries)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(
+                        "Starting download for row_id=%s, url=%s, retries=%s",
+                        row_id, url, retries)
                 asyncio.create_task(
                     self._start_download_async(row_id, url, retries))
-                await self.show_status(gettext("🚀 Starting download for ID {}...").format(row_id))
+                self.mark_dirty()
+                await self.show_status(texts['starting'].format(row_id))
 
             except (ValueError, RuntimeError, KeyError, TypeError) as e:
                 self.logger.error("Error starting download: %s", e)
-                await self.show_status(gettext("✗ Error: %s") % str(e))
+                await self.show_status(texts['error'] % str(e))
         else:
-            await self.show_status(gettext("⚠ No item selected"))
+            await self.show_status(texts['no_selection'])
 
     async def _start_download_async(self, download_id: int, url: str, retries: int) -> None:
         """Start download asynchronously in the background."""
+        texts = self.ui_state['texts']
         try:
             # Run the download in a thread to avoid blocking the UI
             def run_download():
                 try:
-                    download_media(self.queue, download_id, url, retries)
-                    return True, None
+                    return download_media(
+                        self.queue, download_id, url, retries), None
                 except (ValueError, RuntimeError) as exc:
-                    return False, str(exc)
+                    return DownloadStatus.FAILED, str(exc)
                 # Do not catch Exception here to avoid W0718
 
             # Use run_in_executor to run the blocking download in a thread
-            loop = asyncio.get_event_loop()
-            success, error = await loop.run_in_executor(None, run_download)
-
-            if success:
-                await self.show_status(gettext("✓ Download completed for ID {}").format(download_id))
+            loop = asyncio.get_running_loop()
+            status, error = await loop.run_in_executor(
+                self.ui_state['download_pool'], run_download)
+
+            if status is None:
+                # The row left the pending queue (e.g. the daemon claimed
+                # it) after the last refresh, so nothing was downloaded
+                await self.show_status(texts['not_found'].format(download_id))
+            elif status is DownloadStatus.DOWNLOADED:
+                await self.show_status(texts['completed'].format(download_id))
             else:
-                await self.show_status(gettext("✗ Download failed for ID {}: {}").format(download_id, error))
+                await self.show_status(texts['failed'].format(
+                    download_id, error or status.value))
 
-            # Refresh data to show updated status
-            await self.refresh_data()
+            # Refresh soon to show the updated status
+            self.mark_dirty()
 
         except (ValueError, RuntimeError) as exc:
             self.logger.error("Error in background download: %s", exc)
-            await self.show_status(gettext("✗ Download error for ID %s: %s") % (download_id, str(exc)))
+            await self.show_status(
+                texts['download_error'] % (download_id, str(exc)))
         # Do not catch Exception here to avoid W0718
 
     async def action_refresh(self) -> None:
         """Manually refresh all data."""
         self.logger.debug("action_refresh called")
         await self.refresh_data()
-        await self.show_status(gettext("🔄 Data refreshed"))
+        self._schedule_auto_refresh()
+        await self.show_status(self.ui_state['texts']['refreshed'])
 
     async def action_quit(self) -> None:
         """Quit the application."""
         self.logger.debug("action_quit called")
+        # Let an in-flight read finish before its connection is closed
+        self.ui_state['db_pool'].shutdown(cancel_futures=True)
+        self.read_queue.close()
+        self.queue.close()
         self.exit()
 
-    async def on_status_update(self, message: StatusUpdate) -> None:
-        """Handle status update messages."""
-        await self.show_status(message.message)
+    def on_unmount(self) -> None:
+        """Release the download threads when the app shuts down."""
+        # Queued downloads are dropped; running ones finish in the background
+        self.ui_state['download_pool'].shutdown(wait=False, cancel_futures=True)
+
+    def schedule_refresh(self) -> None:
+        """Schedule a debounced refresh unless one is already pending.
 
-    async def on_refresh_data(self, _: RefreshData) -> None:
-        """Handle refresh data messages."""
+        Requests arriving within REFRESH_DEBOUNCE_SECONDS of each other are
+        coalesced into a single refresh.
+        """
+        if self.ui_state['refresh_task'] is None:
+            self.ui_state['refresh_task'] = asyncio.create_task(
+                self._debounced_refresh())
+
+    async def _debounced_refresh(self) -> None:
+        """Wait for the debounce delay, then refresh all tables."""
+        try:
+            await asyncio.sleep(REFRESH_DEBOUNCE_SECONDS)
+        finally:
+            # Later requests schedule a new refresh once this one starts
+            self.ui_state['refresh_task'] = None
         await self.refresh_data()
 
     async def show_status(self, message: str) -> None:
@@ -585,24 +813,27 @@ class TUIApp(App):
 
         # Update the status label
         try:
-            status_label = self.query_one("#status-label", Label)
+            status_label = self._widget("#status-label", Label)
             status_label.update(message)
 
-            # Cancel previous auto-clear task
-            if self.ui_state['last_status_task']:
-                self.ui_state['last_status_task'].cancel()
-
-            # Auto-clear status after 3 seconds
-            self.ui_state['last_status_task'] = asyncio.create_task(
-                self._clear_status_after_delay())
+            # Push the clear deadline back; a burst of messages shares one
+            # clearing task instead of cancelling and spawning one each
+            self.ui_state['status_deadline'] = (
+                asyncio.get_running_loop().time() + STATUS_CLEAR_SECONDS)
+            task = self.ui_state['status_task']
+            if task is None or task.done():
+                self.ui_state['status_task'] = asyncio.create_task(
+                    self._clear_status_when_due())
         except (ValueError, KeyError, RuntimeError) as exc:
             self.logger.debug("Error updating status label: %s", exc)
 
-    async def _clear_status_after_delay(self):
-        """Clear status message after a delay."""
+    async def _clear_status_when_due(self):
+        """Clear the status message once its deadline has passed."""
+        loop = asyncio.get_running_loop()
         try:
-            await asyncio.sleep(3)
-            status_label = self.query_one("#status-label", Label)
+            while (remaining := self.ui_state['status_deadline'] - loop.time()) > 0:
+                await asyncio.sleep(remaining)
+            status_label = self._widget("#status-label", Label)
             status_label.update("")
         except asyncio.CancelledError:
             pass
@@ -611,6 +842,14 @@ class TUIApp(App):
         # Only catch specific exceptions, not Exception
 
 
+def _uvloop_factory():
+    """Return uvloop's event loop factory, or None if it is not installed."""
+    try:
+        return importlib.import_module('uvloop').new_event_loop
+    except ImportError:  # Optional speedup, not available on Windows
+        return None
+
+
 def main(recent_limit: int = 10):
     """Main entry point for the TUI.
 
@@ -618,7 +857,12 @@ def main(recent_limit: int = 10):
         recent_limit: Number of recent completed downloads to show
     """
     app = TUIApp(recent_limit=recent_limit)
-    app.run()
+    loop_factory = _uvloop_factory()
+    if loop_factory is None:
+        app.run()
+        return
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(app.run_async())
 
 
 if __name__ == "__main__":